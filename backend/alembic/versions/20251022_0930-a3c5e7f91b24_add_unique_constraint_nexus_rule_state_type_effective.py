@@ -0,0 +1,50 @@
+"""Add unique constraint on nexus rule state, type and effective date
+
+Revision ID: a3c5e7f91b24
+Revises: 960c17b69128
+Create Date: 2025-10-22 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c5e7f91b24'
+down_revision: Union[str, None] = '960c17b69128'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add unique constraint so nexus rule seeds can be idempotent."""
+    # Re-running the old loaders could insert the same rule twice; keep the
+    # earliest-created copy of each (state_code, nexus_type, effective_date)
+    op.execute("""
+        DELETE FROM nexus_rules
+        WHERE rule_id IN (
+            SELECT rule_id FROM (
+                SELECT rule_id,
+                       row_number() OVER (
+                           PARTITION BY state_code, nexus_type, effective_date
+                           ORDER BY created_at, rule_id
+                       ) AS copy_number
+                FROM nexus_rules
+            ) AS copies
+            WHERE copy_number > 1
+        )
+    """)
+
+    # Create unique constraint on (state_code, nexus_type, effective_date)
+    op.create_unique_constraint(
+        'uq_nexus_rule_state_type_effective',  # constraint name
+        'nexus_rules',  # table name
+        ['state_code', 'nexus_type', 'effective_date']  # columns
+    )
+
+
+def downgrade() -> None:
+    """Remove unique constraint."""
+    op.drop_constraint('uq_nexus_rule_state_type_effective', 'nexus_rules', type_='unique')
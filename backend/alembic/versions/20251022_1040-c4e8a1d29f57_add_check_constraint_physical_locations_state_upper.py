@@ -0,0 +1,34 @@
+"""Add check constraint that physical location state codes are upper-case
+
+Revision ID: c4e8a1d29f57
+Revises: a3c5e7f91b24
+Create Date: 2025-10-22 10:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a1d29f57'
+down_revision: Union[str, None] = 'a3c5e7f91b24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Normalize existing state codes, then require upper-case going forward."""
+    op.execute("UPDATE physical_locations SET state = upper(state) WHERE state <> upper(state)")
+
+    op.create_check_constraint(
+        'ck_physical_locations_state_upper',  # constraint name
+        'physical_locations',  # table name
+        'state = upper(state)'  # condition
+    )
+
+
+def downgrade() -> None:
+    """Remove check constraint (state codes are left upper-cased)."""
+    op.drop_constraint('ck_physical_locations_state_upper', 'physical_locations', type_='check')
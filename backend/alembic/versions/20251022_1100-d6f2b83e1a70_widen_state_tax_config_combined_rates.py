@@ -0,0 +1,40 @@
+"""Widen state tax config combined rates to hold percentages of 10 or more
+
+Revision ID: d6f2b83e1a70
+Revises: c4e8a1d29f57
+Create Date: 2025-10-22 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6f2b83e1a70'
+down_revision: Union[str, None] = 'c4e8a1d29f57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Allow combined rates like 13.5000 (percent)."""
+    for column in ('min_combined_rate', 'max_combined_rate'):
+        op.alter_column(
+            'state_tax_config', column,
+            existing_type=sa.Numeric(precision=5, scale=4),
+            type_=sa.Numeric(precision=6, scale=4),
+            existing_nullable=True
+        )
+
+
+def downgrade() -> None:
+    """Narrow combined rates back (fails if any stored rate is 10 or more)."""
+    for column in ('min_combined_rate', 'max_combined_rate'):
+        op.alter_column(
+            'state_tax_config', column,
+            existing_type=sa.Numeric(precision=6, scale=4),
+            type_=sa.Numeric(precision=5, scale=4),
+            existing_nullable=True
+        )
@@ -153,10 +153,7 @@ async def login(
         )
 
     # Find user
-    user = db.query(User).filter(
-        User.email == credentials.email,
-        User.tenant_id == tenant.tenant_id
-    ).first()
+    user = auth_service.get_user_by_email(db, credentials.email, tenant.tenant_id)
 
     if not user:
         # Log failed attempt
@@ -206,6 +203,10 @@ async def login(
             detail="User account is inactive"
         )
 
+    # Upgrade legacy (bcrypt) hashes now that we have the plain password
+    if auth_service.password_needs_rehash(user.password_hash):
+        user.password_hash = auth_service.hash_password(credentials.password)
+
     # Update last login
     user.last_login = datetime.utcnow()
     db.commit()
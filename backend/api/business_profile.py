@@ -91,7 +91,7 @@ async def get_business_profile(
     Returns business profile with all physical locations.
     """
 
-    profile = db.query(BusinessProfile).filter(
+    profile = business_profile_service.with_locations(db.query(BusinessProfile)).filter(
         BusinessProfile.profile_id == profile_id
     ).first()
 
@@ -139,7 +139,7 @@ async def get_business_profile_by_analysis(
         )
 
     # Get business profile
-    profile = db.query(BusinessProfile).filter(
+    profile = business_profile_service.with_locations(db.query(BusinessProfile)).filter(
         BusinessProfile.analysis_id == analysis_id
     ).first()
 
@@ -165,7 +165,7 @@ async def get_business_profile_with_nexus(
     containing list of state codes where physical nexus exists.
     """
 
-    profile = db.query(BusinessProfile).filter(
+    profile = business_profile_service.with_locations(db.query(BusinessProfile)).filter(
         BusinessProfile.profile_id == profile_id
     ).first()
 
@@ -210,7 +210,7 @@ async def update_business_profile(
     Only provided fields will be updated.
     """
 
-    profile = db.query(BusinessProfile).filter(
+    profile = business_profile_service.with_locations(db.query(BusinessProfile)).filter(
         BusinessProfile.profile_id == profile_id
     ).first()
 
@@ -500,7 +500,7 @@ async def get_nexus_factors(
     inventory, marketplace facilitators, and product types.
     """
 
-    profile = db.query(BusinessProfile).filter(
+    profile = business_profile_service.with_locations(db.query(BusinessProfile)).filter(
         BusinessProfile.profile_id == profile_id
     ).first()
 
@@ -540,7 +540,7 @@ async def validate_profile_completeness(
     Returns validation status and list of missing/recommended fields.
     """
 
-    profile = db.query(BusinessProfile).filter(
+    profile = business_profile_service.with_locations(db.query(BusinessProfile)).filter(
         BusinessProfile.profile_id == profile_id
     ).first()
 
@@ -3,10 +3,18 @@ Database configuration and session management.
 """
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from config import settings
 
+# Driver-specific engine options
+driver_options = {}
+if make_url(settings.DATABASE_URL).get_driver_name() == "psycopg2":
+    # Send INSERT executemany as multi-row VALUES and batch UPDATE/DELETE
+    driver_options["executemany_mode"] = "values_plus_batch"
+    driver_options["executemany_batch_page_size"] = 500  # Statements per UPDATE/DELETE batch
+
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.DATABASE_URL,
@@ -14,6 +22,9 @@ engine = create_engine(
     pool_size=10,  # Maximum number of connections to keep persistently
     max_overflow=20,  # Maximum number of connections to create beyond pool_size
     echo=settings.DEBUG,  # Log SQL queries in debug mode
+    query_cache_size=1200,  # Compiled-statement cache entries (default 500)
+    insertmanyvalues_page_size=1000,  # Rows per multi-row INSERT (seeds fit in one)
+    **driver_options,
 )
 
 # Create SessionLocal class
@@ -50,7 +50,7 @@ class LiabilityEstimate(Base):
     taxable_sales = Column(Numeric(12, 2), default=0, nullable=False)
 
     # Tax rates
-    state_tax_rate = Column(Numeric(5, 4), nullable=False)  # e.g., 0.0650 for 6.5%
+    state_tax_rate = Column(Numeric(5, 4), nullable=False)  # e.g., 6.5000 for 6.5%
     avg_local_tax_rate = Column(Numeric(5, 4), default=0, nullable=False)
     combined_tax_rate = Column(Numeric(5, 4), nullable=False)
 
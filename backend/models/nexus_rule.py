@@ -2,7 +2,7 @@
 Nexus Rules model for state tax nexus thresholds.
 """
 
-from sqlalchemy import Column, String, DateTime, Numeric, Date, Enum as SQLEnum, Integer, Boolean
+from sqlalchemy import Column, String, DateTime, Numeric, Date, Enum as SQLEnum, Integer, Boolean, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 import uuid
@@ -86,6 +86,12 @@ class NexusRule(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    # Unique constraint: one rule per state, nexus type and effective date
+    # (lets seeders use INSERT ... ON CONFLICT DO NOTHING)
+    __table_args__ = (
+        UniqueConstraint('state_code', 'nexus_type', 'effective_date', name='uq_nexus_rule_state_type_effective'),
+    )
+
     @property
     def state(self):
         """Backwards compatibility property - returns state_code."""
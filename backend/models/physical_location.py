@@ -2,12 +2,13 @@
 Physical Location model for tracking physical presence.
 """
 
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum as SQLEnum, Date
+from sqlalchemy import Column, String, DateTime, ForeignKey, Enum as SQLEnum, Date, CheckConstraint
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 import uuid
 import enum
+import sys
 from database import Base
 
 
@@ -69,5 +70,14 @@ class PhysicalLocation(Base):
     # Relationships
     business_profile = relationship("BusinessProfile", back_populates="physical_locations")
 
+    __table_args__ = (
+        CheckConstraint('state = upper(state)', name='ck_physical_locations_state_upper'),
+    )
+
+    @validates('state')
+    def validate_state(self, key, value):
+        """Store state codes upper-cased (and interned) so readers can use them as-is."""
+        return sys.intern(value.upper()) if value is not None else value
+
     def __repr__(self):
         return f"<PhysicalLocation {self.location_type} in {self.state}>"
@@ -27,11 +27,11 @@ class StateTaxConfig(Base):
     state_code = Column(String(2), unique=True, nullable=False, index=True)
     state_name = Column(String(50), nullable=False)
 
-    # Tax rates
-    state_tax_rate = Column(Numeric(5, 4), nullable=False)  # e.g., 0.0650 for 6.5%
+    # Tax rates (percent)
+    state_tax_rate = Column(Numeric(5, 4), nullable=False)  # e.g., 6.5000 for 6.5%
     avg_local_tax_rate = Column(Numeric(5, 4), default=0, nullable=False)
-    min_combined_rate = Column(Numeric(5, 4), nullable=True)
-    max_combined_rate = Column(Numeric(5, 4), nullable=True)
+    min_combined_rate = Column(Numeric(6, 4), nullable=True)  # Combined rates can reach 10%+
+    max_combined_rate = Column(Numeric(6, 4), nullable=True)
 
     # Sales tax status
     has_sales_tax = Column(Boolean, default=True, nullable=False)
@@ -186,11 +186,12 @@ def aggregate_state_data(df: pd.DataFrame) -> Dict[str, Dict]:
 
         state_df = df[df['state'] == state_code]
 
-        # Calculate aggregates
-        state_tax_rate = state_df['staterate_clean'].mean()
-        avg_local_rate = state_df['localrate'].mean()
-        min_combined = state_df['combinedrate_clean'].min()
-        max_combined = state_df['combinedrate_clean'].max()
+        # Calculate aggregates, stored as percentages like the rest of
+        # state_tax_config (e.g. 6.5 for 6.5%)
+        state_tax_rate = state_df['staterate_clean'].mean() * 100
+        avg_local_rate = state_df['localrate'].mean() * 100
+        min_combined = state_df['combinedrate_clean'].min() * 100
+        max_combined = state_df['combinedrate_clean'].max() * 100
 
         # Check if state has local taxes (any non-zero local rate)
         has_local_taxes = (state_df['localrate'] > 0).any()
@@ -260,8 +261,8 @@ def create_state_tax_config(
 
             db.add(config)
             logger.info(
-                f"  Added {state_code}: {state_data['state_tax_rate']:.2%} state, "
-                f"{state_data['avg_local_tax_rate']:.2%} avg local "
+                f"  Added {state_code}: {state_data['state_tax_rate']:.2f}% state, "
+                f"{state_data['avg_local_tax_rate']:.2f}% avg local "
                 f"({state_data['sample_size']:,} ZIP codes)"
             )
 
@@ -376,9 +377,9 @@ def main():
         for config in configs:
             logger.info(
                 f"{config.state_code} - {config.state_name:20s}: "
-                f"{float(config.state_tax_rate):6.2%} state, "
-                f"{float(config.avg_local_tax_rate):6.2%} avg local, "
-                f"range: {float(config.min_combined_rate):6.2%} - {float(config.max_combined_rate):6.2%}"
+                f"{float(config.state_tax_rate):5.2f}% state, "
+                f"{float(config.avg_local_tax_rate):5.2f}% avg local, "
+                f"range: {float(config.min_combined_rate):5.2f}% - {float(config.max_combined_rate):5.2f}%"
             )
 
     finally:
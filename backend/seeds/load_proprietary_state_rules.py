@@ -21,10 +21,15 @@ import json
 import logging
 from pathlib import Path
 from datetime import datetime, date
-from typing import Dict, List, Optional
+from decimal import Decimal, InvalidOperation
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import argparse
 import sys
 
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 from models.nexus_rule import (
     NexusRule,
@@ -37,30 +42,75 @@ from database import SessionLocal
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of threads used to parse state files before the bulk insert
+PARSE_WORKERS = 8
+
+# Idempotent INSERT ... ON CONFLICT DO NOTHING per dialect, keyed on the
+# uq_nexus_rule_state_type_effective constraint (same as nexus_rules_seed),
+# so rules already seeded or loaded are skipped instead of failing the load
+_CONFLICT_COLUMNS = ['state_code', 'nexus_type', 'effective_date']
+_INSERT_NEXUS_RULES = {
+    "postgresql": pg_insert(NexusRule).on_conflict_do_nothing(index_elements=_CONFLICT_COLUMNS),
+    "sqlite": sqlite_insert(NexusRule).on_conflict_do_nothing(index_elements=_CONFLICT_COLUMNS),
+}
+
+# JSON measurement window strings -> MeasurementPeriod
+MEASUREMENT_WINDOW_MAP = {
+    "rolling_12_months": MeasurementPeriod.ROLLING_12_MONTHS,
+    "calendar_year": MeasurementPeriod.CALENDAR_YEAR,
+    "previous_calendar_year": MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
+    "trailing_12_months": MeasurementPeriod.ROLLING_12_MONTHS,  # Alias
+}
+
+# Explicit JSON threshold_type strings -> ThresholdMeasurement
+THRESHOLD_TYPE_MAP = {
+    "sales_and_transactions": ThresholdMeasurement.SALES_AND_TRANSACTIONS,
+    "both": ThresholdMeasurement.SALES_AND_TRANSACTIONS,
+    "sales_or_transactions": ThresholdMeasurement.SALES_OR_TRANSACTIONS,
+    "either": ThresholdMeasurement.SALES_OR_TRANSACTIONS,
+}
+
+# Optional threshold fields that must be strings when present
+THRESHOLD_STRING_FIELDS = (
+    "effective_date",
+    "end_date",
+    "measurement_window",
+    "threshold_type",
+    "description",
+    "registration_url",
+    "rule_source_url",
+    "source_url",
+)
+
+# Enum members used on every parsed row
+DEFAULT_NEXUS_TYPE = NexusType.ECONOMIC  # Most common; adjust if needed
+DEFAULT_MEASUREMENT_PERIOD = MeasurementPeriod.ROLLING_12_MONTHS
+SALES_ONLY = ThresholdMeasurement.SALES_ONLY
+TRANSACTIONS_ONLY = ThresholdMeasurement.TRANSACTIONS_ONLY
+SALES_OR_TRANSACTIONS = ThresholdMeasurement.SALES_OR_TRANSACTIONS
+
 
+@lru_cache(maxsize=64)
 def parse_measurement_window(window_str: str) -> MeasurementPeriod:
     """
     Map JSON measurement window strings to MeasurementPeriod enum.
 
+    Cached: state files reuse a handful of window strings, and an unknown
+    one is only warned about once.
+
     Args:
         window_str: String like "rolling_12_months", "calendar_year", etc.
 
     Returns:
         MeasurementPeriod enum value
     """
-    mapping = {
-        "rolling_12_months": MeasurementPeriod.ROLLING_12_MONTHS,
-        "calendar_year": MeasurementPeriod.CALENDAR_YEAR,
-        "previous_calendar_year": MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
-        "trailing_12_months": MeasurementPeriod.ROLLING_12_MONTHS,  # Alias
-    }
-
-    result = mapping.get(window_str.lower(), MeasurementPeriod.ROLLING_12_MONTHS)
+    result = MEASUREMENT_WINDOW_MAP.get(window_str.lower())
 
-    if window_str.lower() not in mapping:
+    if result is None:
         logger.warning(
-            f"Unknown measurement window '{window_str}', defaulting to ROLLING_12_MONTHS"
+            "Unknown measurement window '%s', defaulting to ROLLING_12_MONTHS", window_str
         )
+        return DEFAULT_MEASUREMENT_PERIOD
 
     return result
 
@@ -79,30 +129,53 @@ def parse_threshold_measurement(threshold_data: Dict) -> ThresholdMeasurement:
     has_transactions = threshold_data.get("transaction_threshold") is not None
 
     # Check if there's a measurement_type field
-    measurement_type = threshold_data.get("threshold_type", "").lower()
-
-    if measurement_type == "sales_and_transactions" or measurement_type == "both":
-        return ThresholdMeasurement.SALES_AND_TRANSACTIONS
-    elif measurement_type == "sales_or_transactions" or measurement_type == "either":
-        return ThresholdMeasurement.SALES_OR_TRANSACTIONS
+    measurement_type = THRESHOLD_TYPE_MAP.get((threshold_data.get("threshold_type") or "").lower())
+    if measurement_type is not None:
+        return measurement_type
 
     # Infer from which thresholds are present
     if has_sales and has_transactions:
         # Default to OR logic if both present but not specified
-        return ThresholdMeasurement.SALES_OR_TRANSACTIONS
+        return SALES_OR_TRANSACTIONS
     elif has_sales:
-        return ThresholdMeasurement.SALES_ONLY
+        return SALES_ONLY
     elif has_transactions:
-        return ThresholdMeasurement.TRANSACTIONS_ONLY
+        return TRANSACTIONS_ONLY
     else:
         logger.warning("No thresholds found, defaulting to SALES_ONLY")
-        return ThresholdMeasurement.SALES_ONLY
+        return SALES_ONLY
 
 
+def parse_amount(value) -> Optional[Decimal]:
+    """
+    Convert a JSON threshold amount to Decimal.
+
+    Goes through str() so float inputs keep their printed value rather than
+    their binary expansion (e.g. 100000.1 -> Decimal("100000.1")).
+
+    Args:
+        value: Number or numeric string like 100000, 100000.0 or "100000"
+
+    Returns:
+        Decimal value or None if missing/unparseable
+    """
+    if value is None:
+        return None
+
+    try:
+        return Decimal(str(value))
+    except InvalidOperation:
+        logger.error("Could not parse amount: %s", value)
+        return None
+
+
+@lru_cache(maxsize=512)
 def parse_date(date_str: str) -> Optional[date]:
     """
     Parse date string in various formats.
 
+    Cached: effective/end dates repeat heavily across states.
+
     Args:
         date_str: Date string like "2019-01-01" or "2019-10-01"
 
@@ -118,145 +191,257 @@ def parse_date(date_str: str) -> Optional[date]:
         try:
             return datetime.strptime(date_str, "%m/%d/%Y").date()
         except ValueError:
-            logger.error(f"Could not parse date: {date_str}")
+            logger.error("Could not parse date: %s", date_str)
             return None
 
 
-def load_state_json(file_path: Path, db: Session, replace_existing: bool = False) -> int:
+def validate_thresholds(state_code: str, thresholds: List) -> None:
     """
-    Load a single state's JSON file into the database.
+    Check the shape of every threshold entry before any parsing is done.
+
+    Validating once up front keeps the parse loop free of per-row
+    exception handling.
+
+    Args:
+        state_code: Two-letter state code (for error context)
+        thresholds: The "thresholds" list from a state JSON file
+
+    Raises:
+        ValueError: If any threshold entry is malformed
+    """
+    if not isinstance(thresholds, list):
+        raise ValueError(f"{state_code}: 'thresholds' must be a list")
+
+    for index, threshold in enumerate(thresholds):
+        if not isinstance(threshold, dict):
+            raise ValueError(f"{state_code} threshold #{index}: expected an object")
+
+        for field in THRESHOLD_STRING_FIELDS:
+            value = threshold.get(field)
+            if value is not None and not isinstance(value, str):
+                raise ValueError(f"{state_code} threshold #{index}: '{field}' must be a string")
+
+        transaction_threshold = threshold.get("transaction_threshold")
+        if transaction_threshold is not None and (
+            isinstance(transaction_threshold, bool) or not isinstance(transaction_threshold, int)
+        ):
+            raise ValueError(f"{state_code} threshold #{index}: 'transaction_threshold' must be an integer")
+
+        legal_citations = threshold.get("legal_citations") or []
+        if not isinstance(legal_citations, list) or not all(isinstance(c, str) for c in legal_citations):
+            raise ValueError(f"{state_code} threshold #{index}: 'legal_citations' must be a list of strings")
+
+
+def parse_state_json(file_path: Path) -> Tuple[Optional[str], List[Dict]]:
+    """
+    Parse a single state's JSON file into NexusRule row mappings.
+
+    This step is DB-free so that multiple files can be parsed concurrently
+    before a single bulk insert.
 
     Args:
         file_path: Path to the JSON file (e.g., Texas.txt)
-        db: Database session
-        replace_existing: If True, delete existing rules for this state first
 
     Returns:
-        Number of rules inserted
+        Tuple of (state_code, list of row dicts); state_code is None if the
+        file could not be read or is malformed
     """
-    logger.info(f"Loading state data from: {file_path}")
+    logger.info("Loading state data from: %s", file_path)
 
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
     except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON in {file_path}: {e}")
-        return 0
+        logger.error("Invalid JSON in %s: %s", file_path, e)
+        return None, []
     except FileNotFoundError:
-        logger.error(f"File not found: {file_path}")
-        return 0
+        logger.error("File not found: %s", file_path)
+        return None, []
 
     state_code = data.get("state_code")
     if not state_code:
-        logger.error(f"No state_code found in {file_path}")
-        return 0
-
-    # Delete existing rules for this state if requested
-    if replace_existing:
-        deleted = db.query(NexusRule).filter(NexusRule.state == state_code).delete()
-        logger.info(f"Deleted {deleted} existing rules for {state_code}")
+        logger.error("No state_code found in %s", file_path)
+        return None, []
 
     thresholds = data.get("thresholds", [])
     if not thresholds:
-        logger.warning(f"No thresholds found for {state_code}")
-        return 0
+        logger.warning("No thresholds found for %s", state_code)
+        return state_code, []
 
-    rules_inserted = 0
+    try:
+        validate_thresholds(state_code, thresholds)
+    except ValueError as e:
+        logger.error("Skipping %s: %s", file_path, e)
+        return None, []
 
-    for threshold in thresholds:
-        try:
-            # Parse dates
-            effective_date = parse_date(threshold.get("effective_date"))
-            end_date = parse_date(threshold.get("end_date"))
+    rows = []
 
-            if not effective_date:
-                logger.warning(f"Skipping threshold with no effective_date in {state_code}")
-                continue
+    for threshold in thresholds:
+        # Parse dates
+        effective_date = parse_date(threshold.get("effective_date"))
+        end_date = parse_date(threshold.get("end_date"))
 
-            # Extract threshold values
-            sales_threshold = threshold.get("sales_threshold")
-            transaction_threshold = threshold.get("transaction_threshold")
-
-            # Parse measurement settings
-            measurement_window = threshold.get("measurement_window", "rolling_12_months")
-            measurement_period = parse_measurement_window(measurement_window)
-            threshold_measurement = parse_threshold_measurement(threshold)
-
-            # Marketplace facilitator rules
-            marketplace_facilitator_law = threshold.get("marketplace_facilitator_law", False)
-            marketplace_sales_excluded = threshold.get("marketplace_sales_excluded", True)
-
-            # Build description from multiple sources
-            description_parts = []
-
-            if threshold.get("description"):
-                description_parts.append(threshold["description"])
-
-            # Add legal citations if available
-            legal_citations = threshold.get("legal_citations", [])
-            if legal_citations:
-                citations_str = "; ".join(legal_citations[:3])  # First 3 citations
-                description_parts.append(f"Legal: {citations_str}")
-
-            # Add confidence score if available
-            confidence = threshold.get("confidence_score")
-            if confidence:
-                description_parts.append(f"Confidence: {confidence}")
-
-            rule_description = " | ".join(description_parts) if description_parts else None
-
-            # Truncate to fit database field (1000 chars)
-            if rule_description and len(rule_description) > 1000:
-                rule_description = rule_description[:997] + "..."
-
-            # Extract URLs
-            registration_url = threshold.get("registration_url")
-            rule_source_url = threshold.get("rule_source_url") or threshold.get("source_url")
-
-            # Create NexusRule
-            nexus_rule = NexusRule(
-                state=state_code,
-                nexus_type=NexusType.ECONOMIC,  # Most common; adjust if needed
-                sales_threshold=sales_threshold,
-                transaction_threshold=transaction_threshold,
-                threshold_measurement=threshold_measurement,
-                measurement_period=measurement_period,
-                marketplace_facilitator_law=marketplace_facilitator_law,
-                marketplace_sales_excluded=marketplace_sales_excluded,
-                effective_date=effective_date,
-                end_date=end_date,
-                rule_description=rule_description,
-                registration_url=registration_url,
-                rule_source_url=rule_source_url
-            )
-
-            db.add(nexus_rule)
-            rules_inserted += 1
-
-            logger.info(
-                f"  Added {state_code} rule: ${sales_threshold or 'N/A'} sales, "
-                f"{transaction_threshold or 'N/A'} txns, effective {effective_date}"
-            )
-
-        except Exception as e:
-            logger.error(f"Error processing threshold in {state_code}: {e}", exc_info=True)
+        if not effective_date:
+            logger.warning("Skipping threshold with no effective_date in %s", state_code)
             continue
 
+        # Extract threshold values
+        sales_threshold = parse_amount(threshold.get("sales_threshold"))
+        transaction_threshold = threshold.get("transaction_threshold")
+
+        # Parse measurement settings
+        measurement_window = threshold.get("measurement_window") or "rolling_12_months"
+        measurement_period = parse_measurement_window(measurement_window)
+        threshold_measurement = parse_threshold_measurement(threshold)
+
+        # Marketplace facilitator rules
+        marketplace_facilitator_law = threshold.get("marketplace_facilitator_law", False)
+        marketplace_sales_excluded = threshold.get("marketplace_sales_excluded", True)
+
+        # Build description from multiple sources
+        description_parts = []
+
+        description = threshold.get("description")
+        if description:
+            description_parts.append(description)
+
+        # Add legal citations if available
+        legal_citations = threshold.get("legal_citations") or []
+        if legal_citations:
+            citations_str = "; ".join(legal_citations[:3])  # First 3 citations
+            description_parts.append(f"Legal: {citations_str}")
+
+        # Add confidence score if available
+        confidence = threshold.get("confidence_score")
+        if confidence:
+            description_parts.append(f"Confidence: {confidence}")
+
+        rule_description = " | ".join(description_parts) if description_parts else None
+
+        # Truncate to fit database field (1000 chars)
+        if rule_description and len(rule_description) > 1000:
+            rule_description = rule_description[:997] + "..."
+
+        # Extract URLs
+        registration_url = threshold.get("registration_url")
+        rule_source_url = threshold.get("rule_source_url") or threshold.get("source_url")
+
+        rows.append({
+            "state_code": state_code,
+            "nexus_type": DEFAULT_NEXUS_TYPE,
+            "sales_threshold": sales_threshold,
+            "transaction_threshold": transaction_threshold,
+            "threshold_measurement": threshold_measurement,
+            "measurement_period": measurement_period,
+            "marketplace_facilitator_law": marketplace_facilitator_law,
+            "marketplace_sales_excluded": marketplace_sales_excluded,
+            "effective_date": effective_date,
+            "end_date": end_date,
+            "rule_description": rule_description,
+            "registration_url": registration_url,
+            "rule_source_url": rule_source_url,
+        })
+
+        logger.info(
+            "  Added %s rule: $%s sales, %s txns, effective %s",
+            state_code, sales_threshold or 'N/A', transaction_threshold or 'N/A', effective_date
+        )
+
+    return state_code, rows
+
+
+def insert_rules(
+    db: Session,
+    parsed: List[Tuple[Optional[str], List[Dict]]],
+    replace_existing: bool = False
+) -> List[int]:
+    """
+    Insert parsed rules for one or more states in a single transaction.
+
+    Each state is written inside its own savepoint, so a state that fails
+    is rolled back on its own and the other states are still committed.
+    Rules that already exist (same state, nexus type and effective date)
+    are skipped.
+
+    Args:
+        db: Database session
+        parsed: List of (state_code, rows) tuples from parse_state_json
+        replace_existing: If True, delete existing rules for each state first
+
+    Returns:
+        Number of rules inserted for each entry of parsed (0 for states that
+        failed, or for everything if the final commit failed)
+    """
+    counts = []
+
     try:
+        dialect_name = db.get_bind().dialect.name
+        if dialect_name not in _INSERT_NEXUS_RULES:
+            raise ValueError(f"Unsupported database for nexus rules load: {dialect_name}")
+        insert_stmt = _INSERT_NEXUS_RULES[dialect_name].returning(NexusRule.rule_id)
+
+        for state_code, rows in parsed:
+            if not state_code:
+                counts.append(0)
+                continue
+
+            try:
+                with db.begin_nested():
+                    # Delete existing rules for this state if requested
+                    if replace_existing:
+                        deleted = db.query(NexusRule).filter(
+                            NexusRule.state_code == state_code
+                        ).delete(synchronize_session=False)
+                        logger.info("Deleted %d existing rules for %s", deleted, state_code)
+
+                    inserted = len(db.execute(insert_stmt, rows).all()) if rows else 0
+            except Exception as e:
+                logger.error("Failed to insert rules for %s: %s", state_code, e)
+                counts.append(0)
+                continue
+
+            logger.info("Inserted %d of %d rules for %s", inserted, len(rows), state_code)
+            counts.append(inserted)
+
         db.commit()
-        logger.info(f"Successfully committed {rules_inserted} rules for {state_code}")
+        logger.info(
+            "Successfully committed %d rules for %d state(s)",
+            sum(counts), sum(1 for state_code, _ in parsed if state_code)
+        )
     except Exception as e:
         db.rollback()
-        logger.error(f"Failed to commit {state_code} rules: {e}")
+        logger.error("Failed to commit rules: %s", e)
+        return [0] * len(parsed)
+
+    return counts
+
+
+def load_state_json(file_path: Path, db: Session, replace_existing: bool = False) -> int:
+    """
+    Load a single state's JSON file into the database.
+
+    Args:
+        file_path: Path to the JSON file (e.g., Texas.txt)
+        db: Database session
+        replace_existing: If True, delete existing rules for this state first
+
+    Returns:
+        Number of rules inserted
+    """
+    state_code, rows = parse_state_json(file_path)
+    if not state_code:
         return 0
 
-    return rules_inserted
+    return insert_rules(db, [(state_code, rows)], replace_existing)[0]
 
 
 def load_all_states(data_dir: Path, db: Session, replace_existing: bool = False) -> Dict[str, int]:
     """
     Load all state JSON files from a directory.
 
+    Files are parsed concurrently, then all rules are written in a single
+    transaction with one bulk insert (and savepoint) per state.
+
     Args:
         data_dir: Directory containing state JSON files (e.g., Texas.txt, Alabama.txt)
         db: Database session
@@ -266,26 +451,25 @@ def load_all_states(data_dir: Path, db: Session, replace_existing: bool = False)
         Dictionary mapping state names to number of rules inserted
     """
     if not data_dir.exists():
-        logger.error(f"Data directory not found: {data_dir}")
+        logger.error("Data directory not found: %s", data_dir)
         return {}
 
     # Find all .txt or .json files
-    state_files = list(data_dir.glob("*.txt")) + list(data_dir.glob("*.json"))
+    state_files = sorted(list(data_dir.glob("*.txt")) + list(data_dir.glob("*.json")))
 
     if not state_files:
-        logger.warning(f"No state files found in {data_dir}")
+        logger.warning("No state files found in %s", data_dir)
         return {}
 
-    logger.info(f"Found {len(state_files)} state files to process")
+    logger.info("Found %d state files to process", len(state_files))
 
-    results = {}
+    with ThreadPoolExecutor(max_workers=PARSE_WORKERS) as executor:
+        parsed = list(executor.map(parse_state_json, state_files))
 
-    for state_file in sorted(state_files):
-        state_name = state_file.stem  # Filename without extension
-        count = load_state_json(state_file, db, replace_existing)
-        results[state_name] = count
+    counts = insert_rules(db, parsed, replace_existing)
 
-    return results
+    # Filename without extension -> rules inserted
+    return {state_file.stem: count for state_file, count in zip(state_files, counts)}
 
 
 def main():
@@ -309,23 +493,35 @@ def main():
         type=str,
         help="Load only a specific state file (e.g., Texas.txt)"
     )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only log warnings and errors (skips per-rule progress output)"
+    )
 
     args = parser.parse_args()
 
+    if args.quiet:
+        logging.getLogger().setLevel(logging.WARNING)
+
     data_dir = Path(args.data_dir)
 
     db = SessionLocal()
 
     try:
+        # Check out the connection before parsing starts so connection setup
+        # (and any connection error) happens once, up front
+        db.connection()
+
         if args.state:
             # Load single state
             state_file = data_dir / args.state
             if not state_file.exists():
-                logger.error(f"State file not found: {state_file}")
+                logger.error("State file not found: %s", state_file)
                 sys.exit(1)
 
             count = load_state_json(state_file, db, args.replace)
-            logger.info(f"\nLoaded {count} rules from {args.state}")
+            logger.info("\nLoaded %d rules from %s", count, args.state)
         else:
             # Load all states
             results = load_all_states(data_dir, db, args.replace)
@@ -337,11 +533,11 @@ def main():
 
             total_rules = 0
             for state_name, count in sorted(results.items()):
-                logger.info(f"  {state_name:20s}: {count:3d} rules")
+                logger.info("  %-20s: %3d rules", state_name, count)
                 total_rules += count
 
             logger.info("=" * 60)
-            logger.info(f"  TOTAL:               {total_rules:3d} rules")
+            logger.info("  TOTAL:               %3d rules", total_rules)
             logger.info("=" * 60)
 
     finally:
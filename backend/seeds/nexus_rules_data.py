@@ -0,0 +1,281 @@
+"""
+Nexus rules seed data.
+Economic nexus thresholds current as of October 2025.
+
+Pure data: importing this module does not open a database session.
+Loaded into the nexus_rules table by seeds/nexus_rules_seed.py.
+"""
+
+from models.nexus_rule import NexusType, ThresholdMeasurement, MeasurementPeriod
+from datetime import date
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+
+# Every seeded rule is economic nexus; applied once per row at build time
+NEXUS_TYPE = NexusType.ECONOMIC
+
+
+class NexusRuleRow(NamedTuple):
+    """One state's economic nexus rule, in NexusRule column terms."""
+    state_code: str
+    sales_threshold: Optional[float]
+    transaction_threshold: Optional[int]
+    threshold_measurement: ThresholdMeasurement
+    measurement_period: MeasurementPeriod
+    effective_date: Tuple[int, int, int]  # (year, month, day); see build_rules_data()
+    rule_description: str
+    registration_threshold_days: int  # Reference only; not a NexusRule column
+
+
+# Effective dates are (year, month, day) ints, turned into date objects
+# only when rows are built.
+NEXUS_RULES = (
+    NexusRuleRow(
+        'AL', 250000.00, None,
+        ThresholdMeasurement.SALES_ONLY, MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
+        (2018, 10, 1), 'Alabama economic nexus: $250,000 in sales', 30,
+    ),
+    NexusRuleRow(
+        'AK', 100000.00, 200,
+        ThresholdMeasurement.SALES_OR_TRANSACTIONS, MeasurementPeriod.CALENDAR_YEAR,
+        (2020, 4, 1), 'Alaska remote seller sales tax: $100k OR 200 transactions', 30,
+    ),
+    NexusRuleRow(
+        'AZ', 100000.00, None,
+        ThresholdMeasurement.SALES_ONLY, MeasurementPeriod.CALENDAR_YEAR,
+        (2019, 10, 1), 'Arizona economic nexus: $100,000 in sales', 60,
+    ),
+    NexusRuleRow(
+        'AR', 100000.00, 200,
+        ThresholdMeasurement.SALES_OR_TRANSACTIONS, MeasurementPeriod.CALENDAR_YEAR,
+        (2019, 7, 1), 'Arkansas economic nexus: $100k OR 200 transactions', 60,
+    ),
+    NexusRuleRow(
+        'CA', 500000.00, None,
+        ThresholdMeasurement.SALES_ONLY, MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
+        (2019, 4, 1), 'California economic nexus: $500,000 in sales', 90,
+    ),
+    NexusRuleRow(
+        'CO', 100000.00, None,
+        ThresholdMeasurement.SALES_ONLY, MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
+        (2019, 6, 1), 'Colorado economic nexus: $100,000 in sales', 30,
+    ),
+    NexusRuleRow(
+        'CT', 100000.00, 200,
+        ThresholdMeasurement.SALES_AND_TRANSACTIONS, MeasurementPeriod.ROLLING_12_MONTHS,
+        (2019, 7, 1), 'Connecticut economic nexus: $100k AND 200 transactions', 60,
+    ),
+    NexusRuleRow(
+        'FL', 100000.00, None,
+        ThresholdMeasurement.SALES_ONLY, MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
+        (2021, 7, 1), 'Florida economic nexus: $100,000 in sales', 30,
+    ),
+    NexusRuleRow(
+        'GA', 100000.00, 200,
+        ThresholdMeasurement.SALES_OR_TRANSACTIONS, MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
+        (2020, 1, 1), 'Georgia economic nexus: $100k OR 200 transactions', 60,
+    ),
+    NexusRuleRow(
+        'HI', 100000.00, 200,
+        ThresholdMeasurement.SALES_OR_TRANSACTIONS, MeasurementPeriod.CALENDAR_YEAR,
+        (2020, 7, 1), 'Hawaii economic nexus: $100k OR 200 transactions', 30,
+    ),
+    NexusRuleRow(
+        'ID', 100000.00, None,
+        ThresholdMeasurement.SALES_ONLY, MeasurementPeriod.CALENDAR_YEAR,
+        (2019, 6, 1), 'Idaho economic nexus: $100,000 in sales', 60,
+    ),
+    NexusRuleRow(
+        'IL', 100000.00, 200,
+        ThresholdMeasurement.SALES_OR_TRANSACTIONS, MeasurementPeriod.ROLLING_12_MONTHS,
+        (2019, 10, 1), 'Illinois economic nexus: $100k OR 200 transactions', 90,
+    ),
+    NexusRuleRow(
+        'IN', 100000.00, 200,
+        ThresholdMeasurement.SALES_OR_TRANSACTIONS, MeasurementPeriod.CALENDAR_YEAR,
+        (2019, 10, 1), 'Indiana economic nexus: $100k OR 200 transactions', 60,
+    ),
+    NexusRuleRow(
+        'IA', 100000.00, None,
+        ThresholdMeasurement.SALES_ONLY, MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
+        (2019, 1, 1), 'Iowa economic nexus: $100,000 in sales', 60,
+    ),
+    NexusRuleRow(
+        'KS', 100000.00, None,
+        ThresholdMeasurement.SALES_ONLY, MeasurementPeriod.CALENDAR_YEAR,
+        (2021, 7, 1), 'Kansas economic nexus: $100,000 in sales', 30,
+    ),
+    NexusRuleRow(
+        'KY', 100000.00, 200,
+        ThresholdMeasurement.SALES_OR_TRANSACTIONS, MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
+        (2019, 7, 1), 'Kentucky economic nexus: $100k OR 200 transactions', 60,
+    ),
+    NexusRuleRow(
+        'LA', 100000.00, 200,
+        ThresholdMeasurement.SALES_OR_TRANSACTIONS, MeasurementPeriod.CALENDAR_YEAR,
+        (2020, 7, 1), 'Louisiana economic nexus: $100k OR 200 transactions', 30,
+    ),
+    NexusRuleRow(
+        'ME', 100000.00, None,
+        ThresholdMeasurement.SALES_ONLY, MeasurementPeriod.CALENDAR_YEAR,
+        (2019, 7, 1), 'Maine economic nexus: $100,000 in sales', 30,
+    ),
+    NexusRuleRow(
+        'MD', 100000.00, 200,
+        ThresholdMeasurement.SALES_OR_TRANSACTIONS, MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
+        (2019, 10, 1), 'Maryland economic nexus: $100k OR 200 transactions', 60,
+    ),
+    NexusRuleRow(
+        'MA', 100000.00, None,
+        ThresholdMeasurement.SALES_ONLY, MeasurementPeriod.CALENDAR_YEAR,
+        (2019, 10, 1), 'Massachusetts economic nexus: $100,000 in sales', 30,
+    ),
+    NexusRuleRow(
+        'MI', 100000.00, 200,
+        ThresholdMeasurement.SALES_OR_TRANSACTIONS, MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
+        (2019, 10, 1), 'Michigan economic nexus: $100k OR 200 transactions', 60,
+    ),
+    NexusRuleRow(
+        'MN', 100000.00, 200,
+        ThresholdMeasurement.SALES_OR_TRANSACTIONS, MeasurementPeriod.ROLLING_12_MONTHS,
+        (2019, 10, 1), 'Minnesota economic nexus: $100k OR 200 transactions (rolling)', 60,
+    ),
+    NexusRuleRow(
+        'MS', 250000.00, None,
+        ThresholdMeasurement.SALES_ONLY, MeasurementPeriod.ROLLING_12_MONTHS,
+        (2020, 1, 1), 'Mississippi economic nexus: $250,000 in sales', 30,
+    ),
+    NexusRuleRow(
+        'MO', 100000.00, None,
+        ThresholdMeasurement.SALES_ONLY, MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
+        (2023, 1, 1), 'Missouri economic nexus: $100,000 in sales', 30,
+    ),
+    NexusRuleRow(
+        'NE', 100000.00, 200,
+        ThresholdMeasurement.SALES_OR_TRANSACTIONS, MeasurementPeriod.CALENDAR_YEAR,
+        (2019, 4, 1), 'Nebraska economic nexus: $100k OR 200 transactions', 60,
+    ),
+    NexusRuleRow(
+        'NV', 100000.00, 200,
+        ThresholdMeasurement.SALES_OR_TRANSACTIONS, MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
+        (2019, 10, 1), 'Nevada economic nexus: $100k OR 200 transactions', 30,
+    ),
+    NexusRuleRow(
+        'NJ', 100000.00, 200,
+        ThresholdMeasurement.SALES_OR_TRANSACTIONS, MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
+        (2018, 11, 1), 'New Jersey economic nexus: $100k OR 200 transactions', 30,
+    ),
+    NexusRuleRow(
+        'NM', 100000.00, None,
+        ThresholdMeasurement.SALES_ONLY, MeasurementPeriod.CALENDAR_YEAR,
+        (2019, 7, 1), 'New Mexico economic nexus: $100,000 in sales', 60,
+    ),
+    NexusRuleRow(
+        'NY', 500000.00, 100,
+        ThresholdMeasurement.SALES_AND_TRANSACTIONS, MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
+        (2019, 6, 1), 'New York economic nexus: $500k AND 100 transactions', 60,
+    ),
+    NexusRuleRow(
+        'NC', 100000.00, 200,
+        ThresholdMeasurement.SALES_OR_TRANSACTIONS, MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
+        (2019, 11, 1), 'North Carolina economic nexus: $100k OR 200 transactions', 60,
+    ),
+    NexusRuleRow(
+        'ND', 100000.00, None,
+        ThresholdMeasurement.SALES_ONLY, MeasurementPeriod.CALENDAR_YEAR,
+        (2019, 10, 1), 'North Dakota economic nexus: $100,000 in sales', 60,
+    ),
+    NexusRuleRow(
+        'OH', 100000.00, 200,
+        ThresholdMeasurement.SALES_OR_TRANSACTIONS, MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
+        (2019, 8, 1), 'Ohio economic nexus: $100k OR 200 transactions', 30,
+    ),
+    NexusRuleRow(
+        'OK', 100000.00, None,
+        ThresholdMeasurement.SALES_ONLY, MeasurementPeriod.CALENDAR_YEAR,
+        (2019, 7, 1), 'Oklahoma economic nexus: $100,000 in sales', 60,
+    ),
+    NexusRuleRow(
+        'PA', 100000.00, None,
+        ThresholdMeasurement.SALES_ONLY, MeasurementPeriod.ROLLING_12_MONTHS,
+        (2019, 7, 1), 'Pennsylvania economic nexus: $100,000 in sales', 60,
+    ),
+    NexusRuleRow(
+        'RI', 100000.00, 200,
+        ThresholdMeasurement.SALES_OR_TRANSACTIONS, MeasurementPeriod.CALENDAR_YEAR,
+        (2019, 7, 1), 'Rhode Island economic nexus: $100k OR 200 transactions', 30,
+    ),
+    NexusRuleRow(
+        'SC', 100000.00, None,
+        ThresholdMeasurement.SALES_ONLY, MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
+        (2019, 4, 26), 'South Carolina economic nexus: $100,000 in sales', 60,
+    ),
+    NexusRuleRow(
+        'SD', 100000.00, 200,
+        ThresholdMeasurement.SALES_OR_TRANSACTIONS, MeasurementPeriod.CALENDAR_YEAR,
+        (2019, 3, 1), 'South Dakota economic nexus: $100k OR 200 transactions (Wayfair origin)', 60,
+    ),
+    NexusRuleRow(
+        'TN', 100000.00, None,
+        ThresholdMeasurement.SALES_ONLY, MeasurementPeriod.ROLLING_12_MONTHS,
+        (2020, 7, 1), 'Tennessee economic nexus: $100,000 in sales', 30,
+    ),
+    NexusRuleRow(
+        'TX', 500000.00, None,
+        ThresholdMeasurement.SALES_ONLY, MeasurementPeriod.ROLLING_12_MONTHS,
+        (2019, 10, 1), 'Texas economic nexus: $500,000 in sales', 30,
+    ),
+    NexusRuleRow(
+        'UT', 100000.00, 200,
+        ThresholdMeasurement.SALES_OR_TRANSACTIONS, MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
+        (2019, 10, 1), 'Utah economic nexus: $100k OR 200 transactions', 60,
+    ),
+    NexusRuleRow(
+        'VT', 100000.00, 200,
+        ThresholdMeasurement.SALES_OR_TRANSACTIONS, MeasurementPeriod.CALENDAR_YEAR,
+        (2019, 7, 1), 'Vermont economic nexus: $100k OR 200 transactions', 30,
+    ),
+    NexusRuleRow(
+        'VA', 100000.00, 200,
+        ThresholdMeasurement.SALES_OR_TRANSACTIONS, MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
+        (2019, 7, 1), 'Virginia economic nexus: $100k OR 200 transactions', 60,
+    ),
+    NexusRuleRow(
+        'WA', 100000.00, None,
+        ThresholdMeasurement.SALES_ONLY, MeasurementPeriod.CALENDAR_YEAR,
+        (2019, 10, 1), 'Washington economic nexus: $100,000 in sales', 30,
+    ),
+    NexusRuleRow(
+        'WV', 100000.00, 200,
+        ThresholdMeasurement.SALES_OR_TRANSACTIONS, MeasurementPeriod.CALENDAR_YEAR,
+        (2019, 1, 1), 'West Virginia economic nexus: $100k OR 200 transactions', 60,
+    ),
+    NexusRuleRow(
+        'WI', 100000.00, None,
+        ThresholdMeasurement.SALES_ONLY, MeasurementPeriod.CALENDAR_YEAR,
+        (2019, 10, 1), 'Wisconsin economic nexus: $100,000 in sales', 60,
+    ),
+    NexusRuleRow(
+        'WY', 100000.00, 200,
+        ThresholdMeasurement.SALES_OR_TRANSACTIONS, MeasurementPeriod.CALENDAR_YEAR,
+        (2019, 7, 1), 'Wyoming economic nexus: $100k OR 200 transactions', 60,
+    ),
+    NexusRuleRow(
+        'DC', 100000.00, 200,
+        ThresholdMeasurement.SALES_OR_TRANSACTIONS, MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
+        (2019, 1, 1), 'DC economic nexus: $100k OR 200 transactions', 60,
+    ),
+)
+
+
+def build_rules_data() -> List[Dict]:
+    """
+    Build the insert mappings (one per state) from NEXUS_RULES.
+
+    Only called once the seeder knows it has to insert, so processes that
+    merely import the data never materialize the row dicts.
+    """
+    return [
+        {**row._asdict(), 'nexus_type': NEXUS_TYPE, 'effective_date': date(*row.effective_date)}
+        for row in NEXUS_RULES
+    ]
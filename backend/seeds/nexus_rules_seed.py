@@ -1,578 +1,150 @@
 """
-Seed data for nexus_rules table.
-Economic nexus thresholds current as of October 2025.
+Seed the nexus_rules table.
+Rule data lives in seeds/nexus_rules_data.py.
 """
 
+from sqlalchemy import func, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
-from models.nexus_rule import NexusRule, ThresholdMeasurement, MeasurementPeriod
-from database import SessionLocal
+from models.nexus_rule import NexusRule
+from seeds.nexus_rules_data import build_rules_data
+import argparse
 import logging
-from datetime import date
+import os
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Set once this process has seeded (or found seeded) the table, so repeat
+# calls skip opening a session and probing the database
+_SEEDED = False
 
-NEXUS_RULES_DATA = [
-    {
-        'state_code': 'AL',
-        'nexus_type': 'economic',
-        'sales_threshold': 250000.00,
-        'transaction_threshold': None,
-        'threshold_type': ThresholdMeasurement.SALES_ONLY,
-        'measurement_period': MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
-        'effective_date': date(2018, 10, 1),
-        'description': 'Alabama economic nexus: $250,000 in sales',
-        'registration_threshold_days': 30
-    },
-    {
-        'state_code': 'AK',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.EITHER,
-        'measurement_period': MeasurementPeriod.CALENDAR_YEAR,
-        'effective_date': date(2020, 4, 1),
-        'description': 'Alaska remote seller sales tax: $100k OR 200 transactions',
-        'registration_threshold_days': 30
-    },
-    {
-        'state_code': 'AZ',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': None,
-        'threshold_type': ThresholdMeasurement.SALES_ONLY,
-        'measurement_period': MeasurementPeriod.CALENDAR_YEAR,
-        'effective_date': date(2019, 10, 1),
-        'description': 'Arizona economic nexus: $100,000 in sales',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'AR',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.EITHER,
-        'measurement_period': MeasurementPeriod.CALENDAR_YEAR,
-        'effective_date': date(2019, 7, 1),
-        'description': 'Arkansas economic nexus: $100k OR 200 transactions',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'CA',
-        'nexus_type': 'economic',
-        'sales_threshold': 500000.00,
-        'transaction_threshold': None,
-        'threshold_type': ThresholdMeasurement.SALES_ONLY,
-        'measurement_period': MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
-        'effective_date': date(2019, 4, 1),
-        'description': 'California economic nexus: $500,000 in sales',
-        'registration_threshold_days': 90
-    },
-    {
-        'state_code': 'CO',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': None,
-        'threshold_type': ThresholdMeasurement.SALES_ONLY,
-        'measurement_period': MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
-        'effective_date': date(2019, 6, 1),
-        'description': 'Colorado economic nexus: $100,000 in sales',
-        'registration_threshold_days': 30
-    },
-    {
-        'state_code': 'CT',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.BOTH,
-        'measurement_period': MeasurementPeriod.ROLLING_12_MONTHS,
-        'effective_date': date(2019, 7, 1),
-        'description': 'Connecticut economic nexus: $100k AND 200 transactions',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'FL',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': None,
-        'threshold_type': ThresholdMeasurement.SALES_ONLY,
-        'measurement_period': MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
-        'effective_date': date(2021, 7, 1),
-        'description': 'Florida economic nexus: $100,000 in sales',
-        'registration_threshold_days': 30
-    },
-    {
-        'state_code': 'GA',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.EITHER,
-        'measurement_period': MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
-        'effective_date': date(2020, 1, 1),
-        'description': 'Georgia economic nexus: $100k OR 200 transactions',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'HI',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.EITHER,
-        'measurement_period': MeasurementPeriod.CALENDAR_YEAR,
-        'effective_date': date(2020, 7, 1),
-        'description': 'Hawaii economic nexus: $100k OR 200 transactions',
-        'registration_threshold_days': 30
-    },
-    {
-        'state_code': 'ID',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': None,
-        'threshold_type': ThresholdMeasurement.SALES_ONLY,
-        'measurement_period': MeasurementPeriod.CALENDAR_YEAR,
-        'effective_date': date(2019, 6, 1),
-        'description': 'Idaho economic nexus: $100,000 in sales',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'IL',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.EITHER,
-        'measurement_period': MeasurementPeriod.ROLLING_12_MONTHS,
-        'effective_date': date(2019, 10, 1),
-        'description': 'Illinois economic nexus: $100k OR 200 transactions',
-        'registration_threshold_days': 90
-    },
-    {
-        'state_code': 'IN',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.EITHER,
-        'measurement_period': MeasurementPeriod.CALENDAR_YEAR,
-        'effective_date': date(2019, 10, 1),
-        'description': 'Indiana economic nexus: $100k OR 200 transactions',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'IA',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': None,
-        'threshold_type': ThresholdMeasurement.SALES_ONLY,
-        'measurement_period': MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
-        'effective_date': date(2019, 1, 1),
-        'description': 'Iowa economic nexus: $100,000 in sales',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'KS',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': None,
-        'threshold_type': ThresholdMeasurement.SALES_ONLY,
-        'measurement_period': MeasurementPeriod.CALENDAR_YEAR,
-        'effective_date': date(2021, 7, 1),
-        'description': 'Kansas economic nexus: $100,000 in sales',
-        'registration_threshold_days': 30
-    },
-    {
-        'state_code': 'KY',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.EITHER,
-        'measurement_period': MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
-        'effective_date': date(2019, 7, 1),
-        'description': 'Kentucky economic nexus: $100k OR 200 transactions',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'LA',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.EITHER,
-        'measurement_period': MeasurementPeriod.CALENDAR_YEAR,
-        'effective_date': date(2020, 7, 1),
-        'description': 'Louisiana economic nexus: $100k OR 200 transactions',
-        'registration_threshold_days': 30
-    },
-    {
-        'state_code': 'ME',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': None,
-        'threshold_type': ThresholdMeasurement.SALES_ONLY,
-        'measurement_period': MeasurementPeriod.CALENDAR_YEAR,
-        'effective_date': date(2019, 7, 1),
-        'description': 'Maine economic nexus: $100,000 in sales',
-        'registration_threshold_days': 30
-    },
-    {
-        'state_code': 'MD',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.EITHER,
-        'measurement_period': MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
-        'effective_date': date(2019, 10, 1),
-        'description': 'Maryland economic nexus: $100k OR 200 transactions',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'MA',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': None,
-        'threshold_type': ThresholdMeasurement.SALES_ONLY,
-        'measurement_period': MeasurementPeriod.CALENDAR_YEAR,
-        'effective_date': date(2019, 10, 1),
-        'description': 'Massachusetts economic nexus: $100,000 in sales',
-        'registration_threshold_days': 30
-    },
-    {
-        'state_code': 'MI',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.EITHER,
-        'measurement_period': MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
-        'effective_date': date(2019, 10, 1),
-        'description': 'Michigan economic nexus: $100k OR 200 transactions',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'MN',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.EITHER,
-        'measurement_period': MeasurementPeriod.ROLLING_12_MONTHS,
-        'effective_date': date(2019, 10, 1),
-        'description': 'Minnesota economic nexus: $100k OR 200 transactions (rolling)',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'MS',
-        'nexus_type': 'economic',
-        'sales_threshold': 250000.00,
-        'transaction_threshold': None,
-        'threshold_type': ThresholdMeasurement.SALES_ONLY,
-        'measurement_period': MeasurementPeriod.ROLLING_12_MONTHS,
-        'effective_date': date(2020, 1, 1),
-        'description': 'Mississippi economic nexus: $250,000 in sales',
-        'registration_threshold_days': 30
-    },
-    {
-        'state_code': 'MO',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': None,
-        'threshold_type': ThresholdMeasurement.SALES_ONLY,
-        'measurement_period': MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
-        'effective_date': date(2023, 1, 1),
-        'description': 'Missouri economic nexus: $100,000 in sales',
-        'registration_threshold_days': 30
-    },
-    {
-        'state_code': 'NE',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.EITHER,
-        'measurement_period': MeasurementPeriod.CALENDAR_YEAR,
-        'effective_date': date(2019, 4, 1),
-        'description': 'Nebraska economic nexus: $100k OR 200 transactions',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'NV',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.EITHER,
-        'measurement_period': MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
-        'effective_date': date(2019, 10, 1),
-        'description': 'Nevada economic nexus: $100k OR 200 transactions',
-        'registration_threshold_days': 30
-    },
-    {
-        'state_code': 'NJ',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.EITHER,
-        'measurement_period': MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
-        'effective_date': date(2018, 11, 1),
-        'description': 'New Jersey economic nexus: $100k OR 200 transactions',
-        'registration_threshold_days': 30
-    },
-    {
-        'state_code': 'NM',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': None,
-        'threshold_type': ThresholdMeasurement.SALES_ONLY,
-        'measurement_period': MeasurementPeriod.CALENDAR_YEAR,
-        'effective_date': date(2019, 7, 1),
-        'description': 'New Mexico economic nexus: $100,000 in sales',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'NY',
-        'nexus_type': 'economic',
-        'sales_threshold': 500000.00,
-        'transaction_threshold': 100,
-        'threshold_type': ThresholdMeasurement.BOTH,
-        'measurement_period': MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
-        'effective_date': date(2019, 6, 1),
-        'description': 'New York economic nexus: $500k AND 100 transactions',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'NC',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.EITHER,
-        'measurement_period': MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
-        'effective_date': date(2019, 11, 1),
-        'description': 'North Carolina economic nexus: $100k OR 200 transactions',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'ND',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': None,
-        'threshold_type': ThresholdMeasurement.SALES_ONLY,
-        'measurement_period': MeasurementPeriod.CALENDAR_YEAR,
-        'effective_date': date(2019, 10, 1),
-        'description': 'North Dakota economic nexus: $100,000 in sales',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'OH',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.EITHER,
-        'measurement_period': MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
-        'effective_date': date(2019, 8, 1),
-        'description': 'Ohio economic nexus: $100k OR 200 transactions',
-        'registration_threshold_days': 30
-    },
-    {
-        'state_code': 'OK',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': None,
-        'threshold_type': ThresholdMeasurement.SALES_ONLY,
-        'measurement_period': MeasurementPeriod.CALENDAR_YEAR,
-        'effective_date': date(2019, 7, 1),
-        'description': 'Oklahoma economic nexus: $100,000 in sales',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'PA',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': None,
-        'threshold_type': ThresholdMeasurement.SALES_ONLY,
-        'measurement_period': MeasurementPeriod.ROLLING_12_MONTHS,
-        'effective_date': date(2019, 7, 1),
-        'description': 'Pennsylvania economic nexus: $100,000 in sales',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'RI',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.EITHER,
-        'measurement_period': MeasurementPeriod.CALENDAR_YEAR,
-        'effective_date': date(2019, 7, 1),
-        'description': 'Rhode Island economic nexus: $100k OR 200 transactions',
-        'registration_threshold_days': 30
-    },
-    {
-        'state_code': 'SC',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': None,
-        'threshold_type': ThresholdMeasurement.SALES_ONLY,
-        'measurement_period': MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
-        'effective_date': date(2019, 4, 26),
-        'description': 'South Carolina economic nexus: $100,000 in sales',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'SD',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.EITHER,
-        'measurement_period': MeasurementPeriod.CALENDAR_YEAR,
-        'effective_date': date(2019, 3, 1),
-        'description': 'South Dakota economic nexus: $100k OR 200 transactions (Wayfair origin)',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'TN',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': None,
-        'threshold_type': ThresholdMeasurement.SALES_ONLY,
-        'measurement_period': MeasurementPeriod.ROLLING_12_MONTHS,
-        'effective_date': date(2020, 7, 1),
-        'description': 'Tennessee economic nexus: $100,000 in sales',
-        'registration_threshold_days': 30
-    },
-    {
-        'state_code': 'TX',
-        'nexus_type': 'economic',
-        'sales_threshold': 500000.00,
-        'transaction_threshold': None,
-        'threshold_type': ThresholdMeasurement.SALES_ONLY,
-        'measurement_period': MeasurementPeriod.ROLLING_12_MONTHS,
-        'effective_date': date(2019, 10, 1),
-        'description': 'Texas economic nexus: $500,000 in sales',
-        'registration_threshold_days': 30
-    },
-    {
-        'state_code': 'UT',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.EITHER,
-        'measurement_period': MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
-        'effective_date': date(2019, 10, 1),
-        'description': 'Utah economic nexus: $100k OR 200 transactions',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'VT',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.EITHER,
-        'measurement_period': MeasurementPeriod.CALENDAR_YEAR,
-        'effective_date': date(2019, 7, 1),
-        'description': 'Vermont economic nexus: $100k OR 200 transactions',
-        'registration_threshold_days': 30
-    },
-    {
-        'state_code': 'VA',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.EITHER,
-        'measurement_period': MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
-        'effective_date': date(2019, 7, 1),
-        'description': 'Virginia economic nexus: $100k OR 200 transactions',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'WA',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': None,
-        'threshold_type': ThresholdMeasurement.SALES_ONLY,
-        'measurement_period': MeasurementPeriod.CALENDAR_YEAR,
-        'effective_date': date(2019, 10, 1),
-        'description': 'Washington economic nexus: $100,000 in sales',
-        'registration_threshold_days': 30
-    },
-    {
-        'state_code': 'WV',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.EITHER,
-        'measurement_period': MeasurementPeriod.CALENDAR_YEAR,
-        'effective_date': date(2019, 1, 1),
-        'description': 'West Virginia economic nexus: $100k OR 200 transactions',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'WI',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': None,
-        'threshold_type': ThresholdMeasurement.SALES_ONLY,
-        'measurement_period': MeasurementPeriod.CALENDAR_YEAR,
-        'effective_date': date(2019, 10, 1),
-        'description': 'Wisconsin economic nexus: $100,000 in sales',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'WY',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.EITHER,
-        'measurement_period': MeasurementPeriod.CALENDAR_YEAR,
-        'effective_date': date(2019, 7, 1),
-        'description': 'Wyoming economic nexus: $100k OR 200 transactions',
-        'registration_threshold_days': 60
-    },
-    {
-        'state_code': 'DC',
-        'nexus_type': 'economic',
-        'sales_threshold': 100000.00,
-        'transaction_threshold': 200,
-        'threshold_type': ThresholdMeasurement.EITHER,
-        'measurement_period': MeasurementPeriod.PREVIOUS_CALENDAR_YEAR,
-        'effective_date': date(2019, 1, 1),
-        'description': 'DC economic nexus: $100k OR 200 transactions',
-        'registration_threshold_days': 60
-    }
-]
+# Idempotent INSERT ... ON CONFLICT DO NOTHING per dialect, keyed on the
+# uq_nexus_rule_state_type_effective constraint. Built once; SQLAlchemy's
+# engine-level compiled cache keys on these constructs.
+_CONFLICT_COLUMNS = ['state_code', 'nexus_type', 'effective_date']
+_INSERT_NEXUS_RULES = {
+    "postgresql": pg_insert(NexusRule).on_conflict_do_nothing(index_elements=_CONFLICT_COLUMNS),
+    "sqlite": sqlite_insert(NexusRule).on_conflict_do_nothing(index_elements=_CONFLICT_COLUMNS),
+}
 
 
 def seed_nexus_rules(db: Session = None):
     """
     Seed nexus_rules table with current economic nexus thresholds.
 
+    Rows are inserted as plain mappings in one executemany; no NexusRule
+    objects are instantiated or tracked by the session. Rules that already
+    exist are skipped by the database (ON CONFLICT DO NOTHING), so the seed
+    is idempotent without a pre-check query.
+
     Args:
-        db: Database session (if None, creates new session)
+        db: Database session (if None, creates new session); must not have
+            a transaction in progress
+
+    Raises:
+        ValueError: If the session is bound to an unsupported database
     """
+    global _SEEDED
+
+    if _SEEDED:
+        return
+
     if db is None:
+        from database import SessionLocal
         db = SessionLocal()
         should_close = True
     else:
         should_close = False
 
     try:
-        # Check if data already exists
-        existing_count = db.query(NexusRule).count()
-        if existing_count > 0:
-            logger.info(f"Nexus rules already seeded ({existing_count} records)")
-            return
+        dialect_name = db.get_bind().dialect.name
+        if dialect_name not in _INSERT_NEXUS_RULES:
+            raise ValueError(f"Unsupported database for nexus rules seed: {dialect_name}")
 
-        # Insert all rules
-        for rule_data in NEXUS_RULES_DATA:
-            nexus_rule = NexusRule(**rule_data)
-            db.add(nexus_rule)
+        # Commits on success, rolls back if anything below raises
+        with db.begin():
+            # Reference data is trivially re-seeded, so skip waiting on the WAL
+            # flush at commit (scoped to this transaction only)
+            if dialect_name == "postgresql":
+                db.execute(text("SET LOCAL synchronous_commit = OFF"))
 
-        db.commit()
-        logger.info(f"Successfully seeded {len(NEXUS_RULES_DATA)} nexus rules")
+            # Insert all rules in a single multi-row statement; rules that are
+            # already present are left untouched, so concurrent seeders are safe
+            rows = build_rules_data()
+            db.execute(_INSERT_NEXUS_RULES[dialect_name], rows)
 
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Error seeding nexus rules: {e}")
-        raise
+        _SEEDED = True
+        logger.info("Successfully seeded nexus rules (%d rules checked)", len(rows))
 
     finally:
         if should_close:
             db.close()
 
 
+def render_seed_sql() -> str:
+    """
+    Render the seed as one self-contained PostgreSQL statement.
+
+    The output can be loaded with psql (e.g. when building a CI database)
+    without going through Python or parameter binding. It is generated
+    from nexus_rules_data, so there is no second copy of the data to keep
+    in sync.
+
+    Returns:
+        INSERT ... VALUES (...), ... ON CONFLICT DO NOTHING statement text
+    """
+    rows = [
+        {
+            # Python-side column defaults don't run for literal SQL
+            'rule_id': func.gen_random_uuid(),
+            'marketplace_facilitator_law': False,
+            'marketplace_sales_excluded': True,
+            **{key: value for key, value in row.items() if key in NexusRule.__table__.c},
+        }
+        for row in build_rules_data()
+    ]
+    stmt = pg_insert(NexusRule).values(rows).on_conflict_do_nothing(index_elements=_CONFLICT_COLUMNS)
+    compiled = stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    return f"{compiled};\n"
+
+
+def prewarm_pool() -> None:
+    """
+    Open (and return to the pool) one database connection.
+
+    Run in the background during startup so the first seed query does not
+    pay for connection setup (DNS, TLS, auth).
+    """
+    from database import engine
+
+    try:
+        with engine.connect():
+            pass
+    except Exception as e:
+        logger.warning("Connection pool prewarm failed: %s", e)
+
+
+# Opt-in: overlap connection setup with the rest of process startup
+if os.getenv('NEXUS_SEED_PREWARM', 'false').lower() in ('1', 'true'):
+    threading.Thread(target=prewarm_pool, name="nexus-seed-prewarm", daemon=True).start()
+
+
 if __name__ == "__main__":
     """Run seed script directly."""
-    logging.basicConfig(level=logging.INFO)
-    seed_nexus_rules()
-    print("Nexus rules seed complete!")
+    parser = argparse.ArgumentParser(description="Seed the nexus_rules table")
+    parser.add_argument(
+        "--sql",
+        action="store_true",
+        help="Print the seed as a PostgreSQL script instead of running it (e.g. > nexus_rules_seed.sql)"
+    )
+    args = parser.parse_args()
+
+    if args.sql:
+        print(render_seed_sql(), end="")
+    else:
+        logging.basicConfig(level=logging.INFO)
+        seed_nexus_rules()
+        print("Nexus rules seed complete!")
@@ -0,0 +1,280 @@
+"""
+State tax configuration seed data.
+Current as of October 2025.
+
+Pure data: loaded into the state_tax_config table by
+seeds/state_tax_config_seed.py, which only imports this module when it
+actually has to insert.
+"""
+
+from datetime import date
+from typing import Dict, List
+
+
+# Seed data is stored as one positional tuple per state, in COLUMNS order.
+# Keys match StateTaxConfig column names; has_mpf_law / mpf_effective_date
+# are reference data only (no columns) and are ignored by the insert.
+COLUMNS = (
+    'state_code',
+    'state_name',
+    'has_sales_tax',
+    'state_tax_rate',
+    'has_local_taxes',
+    'avg_local_tax_rate',
+    'max_combined_rate',
+    'has_mpf_law',
+    'mpf_effective_date',
+    'registration_url',
+    'special_notes',
+)
+
+# Shared tail (everything after state_code/state_name) for the states with
+# no state or local sales tax
+_NO_SALES_TAX = (False, 0.00, False, 0.00, 0.00, False, None, None, 'No sales tax')
+
+STATE_TAX_ROWS = (
+    (
+        'AL', 'Alabama', True, 4.00, True, 5.22, 13.50, True, date(2019, 1, 1),
+        'https://www.revenue.alabama.gov/sales-use/',
+        'Marketplace facilitator law effective Jan 1, 2019',
+    ),
+    (
+        'AK', 'Alaska', False, 0.00, True, 1.76, 7.50, True, date(2020, 4, 1),
+        'https://www.commerce.alaska.gov/web/dcra/TaxDivision.aspx',
+        'No state sales tax, but local jurisdictions may impose',
+    ),
+    (
+        'AZ', 'Arizona', True, 5.60, True, 2.77, 11.20, True, date(2019, 10, 1),
+        'https://azdor.gov/transaction-privilege-tax',
+        'Transaction Privilege Tax (TPT)',
+    ),
+    (
+        'AR', 'Arkansas', True, 6.50, True, 2.93, 11.63, True, date(2019, 7, 1),
+        'https://www.dfa.arkansas.gov/excise-tax/sales-and-use-tax/',
+        None,
+    ),
+    (
+        'CA', 'California', True, 7.25, True, 2.68, 10.75, True, date(2019, 10, 1),
+        'https://www.cdtfa.ca.gov/taxes-and-fees/sales-and-use-tax.htm',
+        'District taxes can apply',
+    ),
+    (
+        'CO', 'Colorado', True, 2.90, True, 4.87, 11.20, True, date(2019, 10, 1),
+        'https://tax.colorado.gov/sales-use-tax',
+        'Home-rule cities require separate registration',
+    ),
+    (
+        'CT', 'Connecticut', True, 6.35, False, 0.00, 6.35, True, date(2019, 7, 1),
+        'https://portal.ct.gov/DRS/Sales-Tax/Sales-Tax',
+        'No local sales tax',
+    ),
+    ('DE', 'Delaware', *_NO_SALES_TAX),
+    (
+        'FL', 'Florida', True, 6.00, True, 1.05, 8.00, True, date(2021, 7, 1),
+        'https://floridarevenue.com/taxes/taxesfees/Pages/sales_tax.aspx',
+        'Discretionary surtax varies by county',
+    ),
+    (
+        'GA', 'Georgia', True, 4.00, True, 3.37, 9.00, True, date(2020, 4, 1),
+        'https://dor.georgia.gov/taxes/business-taxes/sales-use-tax',
+        None,
+    ),
+    (
+        'HI', 'Hawaii', True, 4.00, True, 0.44, 4.50, True, date(2020, 7, 1),
+        'https://tax.hawaii.gov/geninfo/general-excise-tax/',
+        'General Excise Tax (GET), not traditional sales tax',
+    ),
+    (
+        'ID', 'Idaho', True, 6.00, True, 0.03, 9.00, True, date(2019, 6, 1),
+        'https://tax.idaho.gov/taxes/sales-tax/',
+        None,
+    ),
+    (
+        'IL', 'Illinois', True, 6.25, True, 2.54, 11.00, True, date(2020, 1, 1),
+        'https://tax.illinois.gov/businesses/taxinformation/sales.html',
+        None,
+    ),
+    (
+        'IN', 'Indiana', True, 7.00, False, 0.00, 7.00, True, date(2019, 7, 1),
+        'https://www.in.gov/dor/business-tax/sales-tax/',
+        'No local sales tax',
+    ),
+    (
+        'IA', 'Iowa', True, 6.00, True, 0.94, 8.00, True, date(2019, 7, 1),
+        'https://tax.iowa.gov/taxes/sales-and-use-tax',
+        None,
+    ),
+    (
+        'KS', 'Kansas', True, 6.50, True, 2.26, 11.50, True, date(2021, 7, 1),
+        'https://www.ksrevenue.gov/taxTypes/salestax.html',
+        None,
+    ),
+    (
+        'KY', 'Kentucky', True, 6.00, False, 0.00, 6.00, True, date(2019, 7, 1),
+        'https://revenue.ky.gov/Collections/Sales-Use-Tax/Pages/default.aspx',
+        'No local sales tax',
+    ),
+    (
+        'LA', 'Louisiana', True, 4.45, True, 5.07, 11.45, True, date(2020, 7, 1),
+        'https://revenue.louisiana.gov/TaxTypes/SalesUseTax',
+        None,
+    ),
+    (
+        'ME', 'Maine', True, 5.50, False, 0.00, 5.50, True, date(2019, 7, 1),
+        'https://www.maine.gov/revenue/taxes/sales-use-tax',
+        'No local sales tax',
+    ),
+    (
+        'MD', 'Maryland', True, 6.00, False, 0.00, 6.00, True, date(2019, 10, 1),
+        'https://www.marylandtaxes.gov/business/sales-use/index.php',
+        'No local sales tax',
+    ),
+    (
+        'MA', 'Massachusetts', True, 6.25, False, 0.00, 6.25, True, date(2019, 10, 1),
+        'https://www.mass.gov/sales-and-use-tax',
+        'No local sales tax',
+    ),
+    (
+        'MI', 'Michigan', True, 6.00, False, 0.00, 6.00, True, date(2019, 10, 1),
+        'https://www.michigan.gov/taxes/business-taxes/sales-use',
+        'No local sales tax',
+    ),
+    (
+        'MN', 'Minnesota', True, 6.875, True, 0.65, 8.875, True, date(2019, 10, 1),
+        'https://www.revenue.state.mn.us/sales-and-use-tax',
+        None,
+    ),
+    (
+        'MS', 'Mississippi', True, 7.00, True, 0.07, 8.00, True, date(2020, 1, 1),
+        'https://www.dor.ms.gov/business/sales-use-tax',
+        None,
+    ),
+    (
+        'MO', 'Missouri', True, 4.225, True, 4.08, 10.85, True, date(2023, 1, 1),
+        'https://dor.mo.gov/taxation/business/sales-use/',
+        None,
+    ),
+    ('MT', 'Montana', *_NO_SALES_TAX),
+    (
+        'NE', 'Nebraska', True, 5.50, True, 1.42, 7.50, True, date(2019, 4, 1),
+        'https://revenue.nebraska.gov/businesses/sales-and-use-tax',
+        None,
+    ),
+    (
+        'NV', 'Nevada', True, 6.85, True, 1.53, 8.38, True, date(2019, 10, 1),
+        'https://tax.nv.gov/businesses/sales___use_tax/',
+        None,
+    ),
+    ('NH', 'New Hampshire', *_NO_SALES_TAX),
+    (
+        'NJ', 'New Jersey', True, 6.625, False, 0.00, 6.625, True, date(2019, 11, 1),
+        'https://www.state.nj.us/treasury/taxation/businesses/salestax/',
+        'No local sales tax',
+    ),
+    (
+        'NM', 'New Mexico', True, 5.125, True, 2.69, 9.06, True, date(2019, 7, 1),
+        'https://www.tax.newmexico.gov/businesses/gross-receipts-tax/',
+        'Gross Receipts Tax',
+    ),
+    (
+        'NY', 'New York', True, 4.00, True, 4.52, 8.875, True, date(2019, 6, 1),
+        'https://www.tax.ny.gov/bus/st/stidx.htm',
+        None,
+    ),
+    (
+        'NC', 'North Carolina', True, 4.75, True, 2.22, 7.50, True, date(2020, 2, 1),
+        'https://www.ncdor.gov/taxes-forms/sales-and-use-tax',
+        None,
+    ),
+    (
+        'ND', 'North Dakota', True, 5.00, True, 2.23, 8.50, True, date(2019, 10, 1),
+        'https://www.tax.nd.gov/business/sales-and-use-tax',
+        None,
+    ),
+    (
+        'OH', 'Ohio', True, 5.75, True, 1.48, 8.00, True, date(2019, 8, 1),
+        'https://tax.ohio.gov/business/ohio-business-taxes/sales-and-use',
+        None,
+    ),
+    (
+        'OK', 'Oklahoma', True, 4.50, True, 4.47, 11.50, True, date(2019, 7, 1),
+        'https://oklahoma.gov/tax/businesses/registration/sales-and-use-tax.html',
+        None,
+    ),
+    ('OR', 'Oregon', *_NO_SALES_TAX),
+    (
+        'PA', 'Pennsylvania', True, 6.00, True, 0.34, 8.00, True, date(2019, 7, 1),
+        'https://www.revenue.pa.gov/TaxTypes/SUT/Pages/default.aspx',
+        'Allegheny County 1%, Philadelphia 2%',
+    ),
+    (
+        'RI', 'Rhode Island', True, 7.00, False, 0.00, 7.00, True, date(2019, 7, 1),
+        'https://tax.ri.gov/tax-types/sales-use-tax',
+        'No local sales tax',
+    ),
+    (
+        'SC', 'South Carolina', True, 6.00, True, 1.46, 9.00, True, date(2019, 4, 26),
+        'https://dor.sc.gov/tax/sales',
+        None,
+    ),
+    (
+        'SD', 'South Dakota', True, 4.50, True, 1.90, 7.50, True, date(2019, 3, 1),
+        'https://dor.sd.gov/businesses/taxes/sales-use-tax/',
+        'Wayfair case originated here',
+    ),
+    (
+        'TN', 'Tennessee', True, 7.00, True, 2.55, 9.75, True, date(2020, 7, 1),
+        'https://www.tn.gov/revenue/taxes/sales-and-use-tax.html',
+        None,
+    ),
+    (
+        'TX', 'Texas', True, 6.25, True, 1.94, 8.25, True, date(2019, 10, 1),
+        'https://comptroller.texas.gov/taxes/sales/',
+        None,
+    ),
+    (
+        'UT', 'Utah', True, 6.10, True, 1.11, 9.05, True, date(2019, 10, 1),
+        'https://tax.utah.gov/sales',
+        None,
+    ),
+    (
+        'VT', 'Vermont', True, 6.00, True, 0.37, 7.00, True, date(2019, 7, 1),
+        'https://tax.vermont.gov/business/sales-and-use-tax',
+        None,
+    ),
+    (
+        'VA', 'Virginia', True, 5.30, True, 0.45, 7.00, True, date(2019, 7, 1),
+        'https://www.tax.virginia.gov/sales-and-use-tax',
+        None,
+    ),
+    (
+        'WA', 'Washington', True, 6.50, True, 2.89, 10.60, True, date(2019, 10, 1),
+        'https://dor.wa.gov/taxes-rates/sales-and-use-tax-rates',
+        None,
+    ),
+    (
+        'WV', 'West Virginia', True, 6.00, True, 0.50, 7.00, True, date(2019, 7, 1),
+        'https://tax.wv.gov/Business/SalesAndUseTax/Pages/SalesAndUseTax.aspx',
+        None,
+    ),
+    (
+        'WI', 'Wisconsin', True, 5.00, True, 0.44, 7.90, True, date(2019, 10, 1),
+        'https://www.revenue.wi.gov/Pages/FAQS/pcs-sales.aspx',
+        None,
+    ),
+    (
+        'WY', 'Wyoming', True, 4.00, True, 1.36, 6.00, True, date(2019, 7, 1),
+        'https://revenue.wyo.gov/excise-tax-division/sales-and-use-tax',
+        None,
+    ),
+    (
+        'DC', 'District of Columbia', True, 6.00, False, 0.00, 6.00, True, date(2019, 4, 1),
+        'https://otr.cfo.dc.gov/page/sales-and-use-tax',
+        'No local sales tax',
+    ),
+)
+
+
+def build_state_tax_data() -> List[Dict]:
+    """Build the insert mappings (one per state); only called when seeding."""
+    return [dict(zip(COLUMNS, row)) for row in STATE_TAX_ROWS]
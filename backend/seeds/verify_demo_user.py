@@ -2,6 +2,7 @@
 Verify demo user exists and has correct boolean field values.
 """
 
+from sqlalchemy import select
 from database import SessionLocal
 from models.user import User
 from models.tenant import Tenant
@@ -10,23 +11,36 @@ def verify_demo_user():
     db = SessionLocal()
 
     try:
-        # Find demo user
-        user = db.query(User).filter(User.email == 'demo@nexusanalyzer.com').first()
+        # Find demo user and its tenant in one round trip, fetching only the
+        # columns printed below (outer join so a missing tenant is reported)
+        user = db.execute(
+            select(
+                User.user_id,
+                User.email,
+                User.first_name,
+                User.last_name,
+                User.role,
+                User.is_active,
+                User.email_verified,
+                User.password_hash,
+                Tenant.subdomain,
+                Tenant.company_name,
+            )
+            .outerjoin(Tenant, Tenant.tenant_id == User.tenant_id)
+            .where(User.email == 'demo@nexusanalyzer.com')
+        ).first()
 
         if not user:
             print("❌ Demo user not found!")
             print("\nRun: python backend/seeds/create_demo_user.py")
             return
 
-        # Get tenant info
-        tenant = db.query(Tenant).filter(Tenant.tenant_id == user.tenant_id).first()
-
         print("="*60)
         print("DEMO USER VERIFICATION")
         print("="*60)
         print(f"✓ User found: {user.email}")
-        print(f"✓ Tenant: {tenant.subdomain if tenant else 'NOT FOUND'}")
-        print(f"  - Company: {tenant.company_name if tenant else 'N/A'}")
+        print(f"✓ Tenant: {user.subdomain or 'NOT FOUND'}")
+        print(f"  - Company: {user.company_name or 'N/A'}")
         print(f"\nUser Details:")
         print(f"  - User ID: {user.user_id}")
         print(f"  - Name: {user.first_name} {user.last_name}")
@@ -2,14 +2,50 @@
 Authentication service for JWT token management and password hashing.
 """
 
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from datetime import timedelta
 from typing import Optional
-from jose import JWTError, jwt
+import jwt
+from jwt.exceptions import PyJWTError as JWTError
 from passlib.context import CryptContext
+from sqlalchemy import bindparam, lambda_stmt, select
+from sqlalchemy.orm import Session
 from config import settings
-
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from models.user import User
+import hashlib
+import threading
+import time
+
+# Password hashing context. New hashes use argon2id; bcrypt hashes still
+# verify and are flagged by needs_update() so they are upgraded on next login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated=["bcrypt"],
+    argon2__type="ID",
+    argon2__memory_cost=64 * 1024,
+    argon2__time_cost=3,
+    argon2__parallelism=2,
+)
+
+# Hash prefixes for the schemes in pwd_context (bcrypt variants, argon2)
+_KNOWN_HASH_PREFIXES = ("$2a$", "$2b$", "$2y$", "$argon2")
+
+# Verified token payloads, keyed by a digest of the token (the raw token is
+# never stored). Entries live at most _PAYLOAD_CACHE_TTL seconds and never
+# past the token's own exp claim; invalid tokens are not cached.
+_PAYLOAD_CACHE_MAXSIZE = 10000
+_PAYLOAD_CACHE_TTL = 30
+_payload_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+_payload_cache_lock = threading.Lock()
+
+# Login lookup, built once; lambda_stmt also caches the statement's cache
+# key so each login only binds email/tenant_id. Backed by uq_user_email_tenant.
+_USER_BY_EMAIL = lambda_stmt(
+    lambda: select(User).where(
+        User.email == bindparam("email"),
+        User.tenant_id == bindparam("tenant_id")
+    )
+)
 
 
 class AuthService:
@@ -27,12 +63,48 @@ class AuthService:
         Returns:
             bool: True if password matches, False otherwise
         """
+        # Hashes pwd_context can't have produced (empty, legacy formats) can
+        # never match; reject them without running a KDF
+        if not hashed_password or not hashed_password.startswith(_KNOWN_HASH_PREFIXES):
+            return False
+
         return pwd_context.verify(plain_password, hashed_password)
 
+    @staticmethod
+    def get_user_by_email(db: Session, email: str, tenant_id) -> Optional[User]:
+        """
+        Look up a user by email within a tenant (the login query).
+
+        Args:
+            db: Database session
+            email: User's email address
+            tenant_id: Tenant's unique identifier
+
+        Returns:
+            User if found, None otherwise
+        """
+        return db.execute(
+            _USER_BY_EMAIL,
+            {"email": email, "tenant_id": tenant_id}
+        ).scalar_one_or_none()
+
+    @staticmethod
+    def password_needs_rehash(hashed_password: str) -> bool:
+        """
+        Check whether a stored hash uses a deprecated scheme or parameters.
+
+        Args:
+            hashed_password: The hashed password from database
+
+        Returns:
+            bool: True if the password should be re-hashed with hash_password
+        """
+        return pwd_context.needs_update(hashed_password)
+
     @staticmethod
     def hash_password(password: str) -> str:
         """
-        Hash a password using bcrypt.
+        Hash a password using argon2id.
 
         Args:
             password: Plain text password
@@ -56,14 +128,12 @@ class AuthService:
         """
         to_encode = data.copy()
 
-        if expires_delta:
-            expire = datetime.utcnow() + expires_delta
-        else:
-            expire = datetime.utcnow() + timedelta(
-                minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-            )
+        if not expires_delta:
+            expires_delta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
-        to_encode.update({"exp": expire, "iat": datetime.utcnow()})
+        # JWT exp/iat are integer epoch seconds; read the clock once
+        now = int(time.time())
+        to_encode.update({"exp": now + int(expires_delta.total_seconds()), "iat": now})
 
         encoded_jwt = jwt.encode(
             to_encode,
@@ -78,22 +148,49 @@ class AuthService:
         """
         Decode and verify a JWT access token.
 
+        Verified payloads are cached briefly (see _PAYLOAD_CACHE_TTL), so a
+        bearer token reused across requests is only verified once.
+
         Args:
             token: JWT token string
 
         Returns:
             dict: Decoded token payload if valid, None if invalid
         """
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        now = time.time()
+
+        with _payload_cache_lock:
+            cached = _payload_cache.get(key)
+            if cached is not None:
+                expires_at, payload = cached
+                if expires_at > now:
+                    return dict(payload)
+                del _payload_cache[key]
+
         try:
             payload = jwt.decode(
                 token,
                 settings.SECRET_KEY,
                 algorithms=[settings.JWT_ALGORITHM]
             )
-            return payload
         except JWTError:
             return None
 
+        # Cache for a short while, but never beyond the token's expiry
+        expires_at = now + _PAYLOAD_CACHE_TTL
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+
+        if expires_at > now:
+            with _payload_cache_lock:
+                _payload_cache[key] = (expires_at, dict(payload))
+                if len(_payload_cache) > _PAYLOAD_CACHE_MAXSIZE:
+                    _payload_cache.popitem(last=False)
+
+        return payload
+
     @staticmethod
     def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
         """
@@ -108,14 +205,12 @@ class AuthService:
         """
         to_encode = data.copy()
 
-        if expires_delta:
-            expire = datetime.utcnow() + expires_delta
-        else:
-            expire = datetime.utcnow() + timedelta(
-                days=settings.REFRESH_TOKEN_EXPIRE_DAYS
-            )
+        if not expires_delta:
+            expires_delta = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
 
-        to_encode.update({"exp": expire, "iat": datetime.utcnow()})
+        # JWT exp/iat are integer epoch seconds; read the clock once
+        now = int(time.time())
+        to_encode.update({"exp": now + int(expires_delta.total_seconds()), "iat": now})
 
         encoded_jwt = jwt.encode(
             to_encode,
@@ -139,22 +234,37 @@ class AuthService:
         Returns:
             dict: Dictionary containing access_token, refresh_token, and token_type
         """
+        # Claims are built complete here (rather than via create_access_token /
+        # create_refresh_token) so each token is one dict and one encode
+        now = int(time.time())
+        sub = str(user_id)
+
         # Access token - short lived
-        access_token_data = {
-            "sub": str(user_id),
-            "tenant_id": str(tenant_id),
-            "email": email,
-            "role": role,
-            "type": "access"
-        }
-        access_token = AuthService.create_access_token(data=access_token_data)
+        access_token = jwt.encode(
+            {
+                "sub": sub,
+                "tenant_id": str(tenant_id),
+                "email": email,
+                "role": role,
+                "type": "access",
+                "exp": now + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+                "iat": now
+            },
+            settings.SECRET_KEY,
+            algorithm=settings.JWT_ALGORITHM
+        )
 
         # Refresh token - longer lived, minimal data
-        refresh_token_data = {
-            "sub": str(user_id),
-            "type": "refresh"
-        }
-        refresh_token = AuthService.create_refresh_token(data=refresh_token_data)
+        refresh_token = jwt.encode(
+            {
+                "sub": sub,
+                "type": "refresh",
+                "exp": now + settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400,
+                "iat": now
+            },
+            settings.SECRET_KEY,
+            algorithm=settings.JWT_ALGORITHM
+        )
 
         return {
             "access_token": access_token,
@@ -2,7 +2,7 @@
 Business profile service for managing business profiles and physical locations.
 """
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Query, Session, selectinload
 from typing import List, Set, Optional
 from datetime import date
 import logging
@@ -16,6 +16,93 @@ logger = logging.getLogger(__name__)
 class BusinessProfileService:
     """Service for business profile operations."""
 
+    @staticmethod
+    def with_locations(query: Query) -> Query:
+        """
+        Eager-load physical_locations on a BusinessProfile query.
+
+        Use this when loading profiles that will be passed to the location
+        accessors below or serialized with their locations, so the
+        locations arrive in one batched SELECT ... WHERE IN rather than a
+        lazy load per profile. The relationship itself stays lazy, so
+        profile loads that never touch locations don't pay for them.
+
+        Args:
+            query: Query selecting BusinessProfile
+
+        Returns:
+            Query with selectinload(BusinessProfile.physical_locations) applied
+        """
+        return query.options(selectinload(BusinessProfile.physical_locations))
+
+    @staticmethod
+    def compute_location_summary(
+        business_profile: BusinessProfile,
+        as_of_date: Optional[date] = None,
+        with_details: bool = False
+    ) -> dict:
+        """
+        Summarize a profile's physical locations in a single pass.
+
+        get_physical_nexus_states, get_physical_nexus_details and
+        determine_nexus_factors share this walk over physical_locations.
+
+        Args:
+            business_profile: BusinessProfile instance
+            as_of_date: Date to check for active locations (defaults to today)
+            with_details: Also build per-location details (only
+                get_physical_nexus_details needs them)
+
+        Returns:
+            Dict with:
+            - location_count: number of locations (active or not)
+            - active_states: set of state codes with a location active on as_of_date
+            - details_by_state: active location details, keyed by state code
+              (empty unless with_details)
+        """
+        if as_of_date is None:
+            as_of_date = date.today()
+
+        location_count = 0
+        active_states: Set[str] = set()
+        details_by_state = {}
+
+        for location in business_profile.physical_locations:
+            location_count += 1
+            state = location.state
+
+            # Active if established on/before as_of_date and not yet closed;
+            # missing dates mean open-ended
+            if not (location.established_date or date.min) <= as_of_date < (location.closed_date or date.max):
+                continue
+
+            active_states.add(state)
+            type_value = location.location_type.value
+
+            if not with_details:
+                logger.debug("Physical nexus in %s: %s at %s", state, type_value, location.city)
+                continue
+
+            if state not in details_by_state:
+                details_by_state[state] = {
+                    'state': state,
+                    'locations': []
+                }
+
+            details_by_state[state]['locations'].append({
+                'location_id': str(location.location_id),
+                'location_type': type_value,
+                'city': location.city,
+                'established_date': location.established_date,
+                'description': location.description
+            })
+
+        return {
+            'location_count': location_count,
+            'active_states': active_states,
+            'details_by_state': details_by_state,
+        }
+
     @staticmethod
     def get_physical_nexus_states(
         business_profile: BusinessProfile,
@@ -45,26 +132,8 @@ class BusinessProfileService:
         if as_of_date is None:
             as_of_date = date.today()
 
-        nexus_states: Set[str] = set()
-
-        for location in business_profile.physical_locations:
-            # Check if location was active on the as_of_date
-            if location.established_date and location.established_date > as_of_date:
-                # Location not yet established
-                continue
-
-            if location.closed_date and location.closed_date <= as_of_date:
-                # Location already closed
-                continue
-
-            # Add state to nexus states
-            nexus_states.add(location.state.upper())
-            logger.debug(
-                f"Physical nexus in {location.state}: "
-                f"{location.location_type.value} at {location.city}"
-            )
-
-        return sorted(list(nexus_states))
+        summary = BusinessProfileService.compute_location_summary(business_profile, as_of_date)
+        return sorted(summary['active_states'])
 
     @staticmethod
     def get_physical_nexus_details(
@@ -87,32 +156,10 @@ class BusinessProfileService:
         if as_of_date is None:
             as_of_date = date.today()
 
-        nexus_details = {}
-
-        for location in business_profile.physical_locations:
-            # Check if location was active
-            if location.established_date and location.established_date > as_of_date:
-                continue
-            if location.closed_date and location.closed_date <= as_of_date:
-                continue
-
-            state = location.state.upper()
-
-            if state not in nexus_details:
-                nexus_details[state] = {
-                    'state': state,
-                    'locations': []
-                }
-
-            nexus_details[state]['locations'].append({
-                'location_id': str(location.location_id),
-                'location_type': location.location_type.value,
-                'city': location.city,
-                'established_date': location.established_date,
-                'description': location.description
-            })
-
-        return nexus_details
+        summary = BusinessProfileService.compute_location_summary(
+            business_profile, as_of_date, with_details=True
+        )
+        return summary['details_by_state']
 
     @staticmethod
     def determine_nexus_factors(business_profile: BusinessProfile) -> dict:
@@ -127,7 +174,7 @@ class BusinessProfileService:
         """
         factors = {
             'has_physical_locations': business_profile.has_physical_presence,
-            'location_count': len(business_profile.physical_locations) if business_profile.has_physical_presence else 0,
+            'location_count': 0,
             'physical_states': [],
             'has_employees': business_profile.has_employees,
             'has_inventory': business_profile.has_inventory,
@@ -141,9 +188,9 @@ class BusinessProfileService:
         }
 
         if business_profile.has_physical_presence:
-            factors['physical_states'] = BusinessProfileService.get_physical_nexus_states(
-                business_profile
-            )
+            summary = BusinessProfileService.compute_location_summary(business_profile)
+            factors['location_count'] = summary['location_count']
+            factors['physical_states'] = sorted(summary['active_states'])
 
         return factors
 
@@ -207,7 +254,7 @@ class BusinessProfileService:
         state_locations = {}
 
         for location in business_profile.physical_locations:
-            state = location.state.upper()
+            state = location.state
 
             if state not in state_locations:
                 state_locations[state] = []
@@ -266,11 +313,11 @@ class BusinessProfileService:
         Returns:
             List of state codes
         """
-        return sorted(list(set(
-            loc.state.upper()
+        return sorted({
+            loc.state
             for loc in business_profile.physical_locations
             if loc.location_type == LocationType.REMOTE_EMPLOYEE
-        )))
+        })
 
 
 # Create global instance
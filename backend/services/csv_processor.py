@@ -2,14 +2,20 @@
 CSV processing service with parsing, validation, and data normalization.
 """
 
+import codecs
 import csv
 import io
 import chardet
 import pandas as pd
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 import logging
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from models.transaction import Transaction
@@ -37,6 +43,28 @@ STATE_CODES = {
 # Reverse mapping
 STATE_NAMES_TO_CODES = {v.upper(): k for k, v in STATE_CODES.items()}
 
+# Upper-cased state code or full name -> two-letter state code
+STATE_LOOKUP = {**{code: code for code in STATE_CODES}, **STATE_NAMES_TO_CODES}
+
+# Standard columns holding identifiers/free text, read as strings so that
+# values like '00123' or '5' aren't inferred as numbers
+TEXT_COLUMNS = ('order_id', 'customer_id', 'marketplace_name')
+
+# Number of invalid rows reported back (with row snapshots) per upload
+MAX_REPORTED_ERRORS = 100
+
+# Lowercased flag values read as True (e.g. in the exempt column)
+TRUTHY_VALUES = {'true', '1', 'yes', 'y', 't'}
+
+# Accepted date formats, tried in order
+DATE_FORMATS = [
+    '%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y',
+    '%Y/%m/%d', '%m-%d-%Y', '%d-%m-%Y'
+]
+
+# Characters that must be backslash-escaped in COPY's text format
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
 
 class ColumnMapping:
     """Column name mappings for different CSV formats."""
@@ -95,6 +123,38 @@ class ColumnMapping:
         'Exempt', 'Tax Exempt', 'Exemption'
     ]
 
+    # Lowercased alias -> standard column name, built once at import
+    CANONICAL = (
+        {alias.lower(): 'transaction_date' for alias in DATE_COLUMNS}
+        | {alias.lower(): 'customer_state' for alias in STATE_COLUMNS}
+        | {alias.lower(): 'gross_amount' for alias in AMOUNT_COLUMNS}
+        | {alias.lower(): 'tax_collected' for alias in TAX_COLUMNS}
+        | {alias.lower(): 'shipping_amount' for alias in SHIPPING_COLUMNS}
+        | {alias.lower(): 'order_id' for alias in ORDER_ID_COLUMNS}
+        | {alias.lower(): 'customer_id' for alias in CUSTOMER_ID_COLUMNS}
+        | {alias.lower(): 'marketplace_name' for alias in MARKETPLACE_COLUMNS}
+        | {alias.lower(): 'is_exempt' for alias in EXEMPT_COLUMNS}
+    )
+
+
+# Every standard column name, in ColumnMapping order
+CANONICAL_COLUMNS = list(dict.fromkeys(ColumnMapping.CANONICAL.values()))
+
+
+@lru_cache(maxsize=128)
+def _normalize_columns(columns: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Map each original column name to its standard name.
+
+    Cached by header, since uploads from the same source repeat the same
+    column layout. Unmapped columns keep their original name, lowercased
+    and snake_cased.
+    """
+    return tuple(
+        (col, ColumnMapping.CANONICAL.get(col.strip().lower(), col.lower().replace(' ', '_')))
+        for col in columns
+    )
+
 
 class CSVProcessor:
     """Process and validate CSV files for transaction data."""
@@ -105,18 +165,36 @@ class CSVProcessor:
         self.valid_row_count = 0
         self.invalid_row_count = 0
 
-    def detect_encoding(self, file_content: bytes) -> str:
+    def detect_encoding(self, file_content: bytes, sample_size: int = 65536) -> str:
         """
-        Detect file encoding using chardet.
+        Detect file encoding.
+
+        UTF-8 (with or without a BOM) is recognized directly; chardet, which
+        is pure Python and slow on large files, only runs on the first
+        sample_size bytes of anything else.
 
         Args:
             file_content: Raw file bytes
+            sample_size: Number of leading bytes passed to chardet
 
         Returns:
             str: Detected encoding (e.g., 'utf-8', 'latin-1')
         """
-        result = chardet.detect(file_content)
+        if file_content.startswith(codecs.BOM_UTF8):
+            return 'utf-8-sig'
+
+        # Validating the whole file as UTF-8 runs in C and covers ASCII too
+        try:
+            file_content.decode('utf-8')
+            return 'utf-8'
+        except UnicodeDecodeError:
+            pass
+
+        result = chardet.detect(file_content[:sample_size])
         encoding = result['encoding'] or 'utf-8'
+        if encoding == 'ascii':
+            # The non-ASCII bytes are past the sample; it isn't UTF-8 either
+            encoding = 'latin-1'
         logger.info(f"Detected encoding: {encoding} (confidence: {result['confidence']})")
         return encoding
 
@@ -130,37 +208,38 @@ class CSVProcessor:
         Returns:
             Dict mapping original column names to normalized names
         """
-        mapping = {}
-
-        for col in columns:
-            col_lower = col.strip().lower()
-
-            # Try to match each column to a standard name
-            if col in self.column_mapping.DATE_COLUMNS or col_lower in [c.lower() for c in self.column_mapping.DATE_COLUMNS]:
-                mapping[col] = 'transaction_date'
-            elif col in self.column_mapping.STATE_COLUMNS or col_lower in [c.lower() for c in self.column_mapping.STATE_COLUMNS]:
-                mapping[col] = 'customer_state'
-            elif col in self.column_mapping.AMOUNT_COLUMNS or col_lower in [c.lower() for c in self.column_mapping.AMOUNT_COLUMNS]:
-                mapping[col] = 'gross_amount'
-            elif col in self.column_mapping.TAX_COLUMNS or col_lower in [c.lower() for c in self.column_mapping.TAX_COLUMNS]:
-                mapping[col] = 'tax_collected'
-            elif col in self.column_mapping.SHIPPING_COLUMNS or col_lower in [c.lower() for c in self.column_mapping.SHIPPING_COLUMNS]:
-                mapping[col] = 'shipping_amount'
-            elif col in self.column_mapping.ORDER_ID_COLUMNS or col_lower in [c.lower() for c in self.column_mapping.ORDER_ID_COLUMNS]:
-                mapping[col] = 'order_id'
-            elif col in self.column_mapping.CUSTOMER_ID_COLUMNS or col_lower in [c.lower() for c in self.column_mapping.CUSTOMER_ID_COLUMNS]:
-                mapping[col] = 'customer_id'
-            elif col in self.column_mapping.MARKETPLACE_COLUMNS or col_lower in [c.lower() for c in self.column_mapping.MARKETPLACE_COLUMNS]:
-                mapping[col] = 'marketplace_name'
-            elif col in self.column_mapping.EXEMPT_COLUMNS or col_lower in [c.lower() for c in self.column_mapping.EXEMPT_COLUMNS]:
-                mapping[col] = 'is_exempt'
-            else:
-                # Keep original name for unmapped columns
-                mapping[col] = col.lower().replace(' ', '_')
+        mapping = dict(_normalize_columns(tuple(columns)))
 
         logger.info(f"Column mapping: {mapping}")
         return mapping
 
+    def _column_dtypes(self, file_content: bytes, encoding: str) -> Dict[str, type]:
+        """
+        Build a read_csv dtype hint from the file's header row.
+
+        Text columns are read as str instead of being inferred, which keeps
+        identifiers like '00123' intact and skips numeric inference on them.
+
+        Args:
+            file_content: Raw CSV file bytes
+            encoding: Encoding to read the header with
+
+        Returns:
+            Dict mapping original column names to dtypes
+        """
+        header = pd.read_csv(
+            io.BytesIO(file_content),
+            encoding=encoding,
+            encoding_errors='ignore',
+            skipinitialspace=True,
+            nrows=0
+        ).columns
+        return {
+            col: str
+            for col, name in _normalize_columns(tuple(header))
+            if name in TEXT_COLUMNS
+        }
+
     def parse_csv(self, file_content: bytes) -> pd.DataFrame:
         """
         Parse CSV file into pandas DataFrame.
@@ -176,13 +255,15 @@ class CSVProcessor:
         """
         # Detect encoding
         encoding = self.detect_encoding(file_content)
+        dtype = self._column_dtypes(file_content, encoding)
 
         try:
             # Try to read with detected encoding
             df = pd.read_csv(
                 io.BytesIO(file_content),
                 encoding=encoding,
-                skipinitialspace=True
+                skipinitialspace=True,
+                dtype=dtype
             )
         except UnicodeDecodeError:
             # Fallback to utf-8 with error handling
@@ -191,7 +272,8 @@ class CSVProcessor:
                 io.BytesIO(file_content),
                 encoding='utf-8',
                 encoding_errors='ignore',
-                skipinitialspace=True
+                skipinitialspace=True,
+                dtype=self._column_dtypes(file_content, 'utf-8')
             )
 
         # Normalize column names
@@ -217,11 +299,7 @@ class CSVProcessor:
         try:
             # Try multiple date formats
             if isinstance(date_value, str):
-                date_formats = [
-                    '%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y',
-                    '%Y/%m/%d', '%m-%d-%Y', '%d-%m-%Y'
-                ]
-                for fmt in date_formats:
+                for fmt in DATE_FORMATS:
                     try:
                         return datetime.strptime(date_value.strip(), fmt)
                     except ValueError:
@@ -248,17 +326,8 @@ class CSVProcessor:
         if pd.isna(state_value):
             return None
 
-        state_str = str(state_value).strip().upper()
-
-        # Check if it's already a valid state code
-        if state_str in STATE_CODES:
-            return state_str
-
-        # Check if it's a full state name
-        if state_str in STATE_NAMES_TO_CODES:
-            return STATE_NAMES_TO_CODES[state_str]
-
-        return None
+        # Accepts either a state code or a full state name
+        return STATE_LOOKUP.get(str(state_value).strip().upper())
 
     def validate_and_convert_amount(self, amount_value: any) -> Optional[Decimal]:
         """
@@ -283,6 +352,24 @@ class CSVProcessor:
         except (InvalidOperation, ValueError):
             return None
 
+    def validate_and_convert_flag(self, flag_value: any) -> bool:
+        """
+        Convert a yes/no flag value.
+
+        Args:
+            flag_value: Flag value (e.g. 'TRUE', 'no', 1)
+
+        Returns:
+            bool: True for truthy values, False otherwise (including missing)
+        """
+        if pd.isna(flag_value):
+            return False
+
+        if isinstance(flag_value, (bool, int, float)):
+            return bool(flag_value)
+
+        return str(flag_value).strip().lower() in TRUTHY_VALUES
+
     def validate_row(self, row: pd.Series, row_number: int) -> Tuple[bool, Optional[Dict]]:
         """
         Validate a single row of data.
@@ -296,28 +383,31 @@ class CSVProcessor:
         """
         errors = []
 
+        # Plain dict lookups instead of a pandas Series lookup per field
+        data = row.to_dict()
+
         # Validate required fields
-        if 'transaction_date' not in row or pd.isna(row.get('transaction_date')):
+        if 'transaction_date' not in data or pd.isna(data.get('transaction_date')):
             errors.append("Missing transaction date")
 
-        if 'customer_state' not in row or pd.isna(row.get('customer_state')):
+        if 'customer_state' not in data or pd.isna(data.get('customer_state')):
             errors.append("Missing customer state")
 
-        if 'gross_amount' not in row or pd.isna(row.get('gross_amount')):
+        if 'gross_amount' not in data or pd.isna(data.get('gross_amount')):
             errors.append("Missing gross amount")
 
         # Convert and validate date
-        transaction_date = self.validate_and_convert_date(row.get('transaction_date'))
-        if transaction_date is None and 'transaction_date' in row:
+        transaction_date = self.validate_and_convert_date(data.get('transaction_date'))
+        if transaction_date is None and 'transaction_date' in data:
             errors.append("Invalid date format")
 
         # Convert and validate state
-        customer_state = self.validate_and_convert_state(row.get('customer_state'))
-        if customer_state is None and 'customer_state' in row:
+        customer_state = self.validate_and_convert_state(data.get('customer_state'))
+        if customer_state is None and 'customer_state' in data:
             errors.append("Invalid state code")
 
         # Convert and validate amount
-        gross_amount = self.validate_and_convert_amount(row.get('gross_amount'))
+        gross_amount = self.validate_and_convert_amount(data.get('gross_amount'))
         if gross_amount is None:
             errors.append("Invalid amount")
 
@@ -325,7 +415,7 @@ class CSVProcessor:
             return False, {
                 'row_number': row_number,
                 'errors': errors,
-                'data': row.to_dict()
+                'data': data
             }
 
         # Build validated data
@@ -333,18 +423,325 @@ class CSVProcessor:
             'transaction_date': transaction_date,
             'customer_state': customer_state,
             'gross_amount': gross_amount,
-            'tax_collected': self.validate_and_convert_amount(row.get('tax_collected', 0)),
-            'shipping_amount': self.validate_and_convert_amount(row.get('shipping_amount', 0)),
-            'order_id': str(row.get('order_id', '')).strip() if pd.notna(row.get('order_id')) else None,
-            'customer_id': str(row.get('customer_id', '')).strip() if pd.notna(row.get('customer_id')) else None,
-            'marketplace_name': str(row.get('marketplace_name', '')).strip() if pd.notna(row.get('marketplace_name')) else None,
-            'is_marketplace_sale': bool(row.get('marketplace_name')) if 'marketplace_name' in row else False,
-            'is_exempt_sale': bool(row.get('is_exempt', False)),
+            'tax_collected': self.validate_and_convert_amount(data.get('tax_collected', 0)),
+            'shipping_amount': self.validate_and_convert_amount(data.get('shipping_amount', 0)),
+            'order_id': str(data.get('order_id', '')).strip() if pd.notna(data.get('order_id')) else None,
+            'customer_id': str(data.get('customer_id', '')).strip() if pd.notna(data.get('customer_id')) else None,
+            'marketplace_name': str(data.get('marketplace_name', '')).strip() if pd.notna(data.get('marketplace_name')) else None,
+            'is_marketplace_sale': pd.notna(data.get('marketplace_name')),
+            'is_exempt_sale': self.validate_and_convert_flag(data.get('is_exempt')),
             'original_row_number': str(row_number)
         }
 
         return True, validated_data
 
+    @staticmethod
+    def _parse_dates(values: pd.Series, date_formats: Optional[List[str]] = None) -> pd.Series:
+        """
+        Vectorized validate_and_convert_date: try each date format in order
+        on the still-unparsed strings. Non-string values are invalid.
+
+        Args:
+            values: Raw transaction_date column
+            date_formats: DATE_FORMATS in the order to try them (defaults
+                to _date_format_order of these values)
+
+        Returns:
+            datetime64 Series (NaT where missing or invalid), or an object
+            Series if some dates fall outside datetime64[ns]'s range
+        """
+        if pd.api.types.is_datetime64_any_dtype(values):
+            return values
+
+        parsed = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns]')
+        if not (pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values)):
+            return parsed
+
+        text = values.str.strip()
+        remaining = text.notna()
+        if date_formats is None:
+            date_formats = CSVProcessor._date_format_order(text[remaining])
+        for fmt in date_formats:
+            if not remaining.any():
+                break
+            parsed[remaining] = pd.to_datetime(text[remaining], format=fmt, errors='coerce')
+            remaining &= parsed.isna()
+
+        return CSVProcessor._parse_out_of_range_dates(parsed, text[remaining], date_formats)
+
+    @staticmethod
+    def _parse_out_of_range_dates(parsed: pd.Series, leftover: pd.Series, date_formats: List[str]) -> pd.Series:
+        """
+        Fill in dates outside datetime64[ns]'s range (1677-2262).
+
+        Dates like 0001-01-01 or 9999-12-31 come back NaT from to_datetime,
+        so the strings still unparsed (mostly invalid ones) get the row
+        path's strptime loop.
+
+        Args:
+            parsed: Dates parsed so far (see _parse_dates)
+            leftover: Stripped strings that didn't parse
+            date_formats: Date formats in the order to try them
+
+        Returns:
+            parsed unchanged if none of leftover parses, otherwise an object
+            Series with the extra dates filled in
+        """
+        fallback = {}
+        for idx, value in leftover.items():
+            for fmt in date_formats:
+                try:
+                    fallback[idx] = datetime.strptime(value, fmt)
+                    break
+                except ValueError:
+                    continue
+
+        if not fallback:
+            return parsed
+
+        parsed = parsed.astype(object)
+        for idx, value in fallback.items():
+            parsed.at[idx] = value
+
+        return parsed
+
+    @staticmethod
+    def _to_datetimes(dates: pd.Series) -> List[datetime]:
+        """Convert parsed dates (see _parse_dates) to datetime insert values."""
+        if pd.api.types.is_datetime64_any_dtype(dates):
+            return dates.array.to_pydatetime().tolist()
+
+        return [value.to_pydatetime() if isinstance(value, pd.Timestamp) else value for value in dates]
+
+    @staticmethod
+    def _date_format_order(values: pd.Series, sample_size: int = 100) -> List[str]:
+        """
+        Order DATE_FORMATS so the formats used by the first sample_size
+        values are tried first.
+
+        A column is almost always in a single format, and a failed
+        to_datetime pass over the whole column costs far more than a
+        successful one. Values that are ambiguous between day-first and
+        month-first therefore follow the format the sample uses, so the
+        order must be computed once per file (process_stream takes it from
+        the first chunk) for every row to be read the same way.
+        """
+        seen = set()
+        for value in values.dropna().head(sample_size):
+            if not isinstance(value, str):
+                continue
+            value = value.strip()
+            for fmt in DATE_FORMATS:
+                try:
+                    datetime.strptime(value, fmt)
+                except ValueError:
+                    continue
+                seen.add(fmt)
+                break
+
+        return [fmt for fmt in DATE_FORMATS if fmt in seen] + [fmt for fmt in DATE_FORMATS if fmt not in seen]
+
+    @staticmethod
+    def _parse_states(values: pd.Series) -> pd.Series:
+        """
+        Vectorized validate_and_convert_state.
+
+        Returns:
+            Series of two-letter state codes (NaN where missing or invalid)
+        """
+        return values.astype('string').str.strip().str.upper().map(STATE_LOOKUP)
+
+    @staticmethod
+    def _parse_amounts(values: pd.Series) -> pd.Series:
+        """
+        Vectorized numeric part of validate_and_convert_amount: strips
+        currency symbols and thousands separators from string values.
+
+        Returns:
+            float64 Series (NaN where missing or invalid)
+        """
+        if pd.api.types.is_numeric_dtype(values):
+            return values.astype('float64')
+
+        text = values.str.strip().str.replace('$', '', regex=False).str.replace(',', '', regex=False)
+        return pd.to_numeric(text, errors='coerce')
+
+    @staticmethod
+    def _to_amounts(amounts: pd.Series, invalid: pd.Series) -> List[Optional[float]]:
+        """
+        Convert parsed amounts to insert values (missing -> 0.0, invalid -> None).
+
+        Amounts stay float64 here; the Numeric(12, 2) columns round them to
+        cents in the database, so no per-value Decimal is built.
+        """
+        return amounts.fillna(0.0).astype(object).where(~invalid, None).tolist()
+
+    @staticmethod
+    def _parse_flags(values: pd.Series) -> pd.Series:
+        """Vectorized validate_and_convert_flag."""
+        if pd.api.types.is_bool_dtype(values):
+            return values
+        if pd.api.types.is_numeric_dtype(values):
+            return values.fillna(0) != 0
+
+        return values.astype('string').str.strip().str.lower().isin(TRUTHY_VALUES)
+
+    @staticmethod
+    def _clean_text(values: pd.Series) -> pd.Series:
+        """Vectorized str(value).strip(), keeping missing values as None."""
+        return values.astype(str).str.strip().astype(object).where(values.notna(), None)
+
+    def _validate_dataframe(
+        self,
+        df: pd.DataFrame,
+        max_errors: int = MAX_REPORTED_ERRORS,
+        date_formats: Optional[List[str]] = None
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Validate and convert a whole DataFrame column-wise.
+
+        Applies the same rules (and produces the same error messages) as
+        validate_row, but with one vectorized pass per column instead of a
+        Python loop over rows.
+
+        Args:
+            df: Parsed DataFrame (normalized column names)
+            max_errors: Maximum number of error dicts to build; later
+                invalid rows are only counted (len(df) - valid rows)
+            date_formats: Date format order (see _parse_dates); pass the
+                same order for every chunk of a file
+
+        Returns:
+            Tuple of (validated row dicts, error dicts), in row order
+        """
+        index = df.index
+        error_masks = []
+
+        # Fixed schema: standard columns the file doesn't have read as all
+        # missing, so the conversions below need no per-column fallbacks
+        fields = df.reindex(columns=CANONICAL_COLUMNS)
+
+        # Required fields
+        for column, message in (
+            ('transaction_date', "Missing transaction date"),
+            ('customer_state', "Missing customer state"),
+            ('gross_amount', "Missing gross amount"),
+        ):
+            error_masks.append((message, fields[column].isna()))
+
+        # Convert and validate date
+        transaction_dates = self._parse_dates(fields['transaction_date'], date_formats)
+        if 'transaction_date' in df.columns:
+            error_masks.append(("Invalid date format", transaction_dates.isna()))
+
+        # Convert and validate state
+        customer_states = self._parse_states(fields['customer_state'])
+        if 'customer_state' in df.columns:
+            error_masks.append(("Invalid state code", customer_states.isna()))
+
+        # Convert and validate amount
+        gross_amounts = self._parse_amounts(fields['gross_amount'])
+        gross_invalid = fields['gross_amount'].notna() & gross_amounts.isna()
+        error_masks.append(("Invalid amount", gross_invalid))
+
+        invalid = pd.Series(False, index=index)
+        for _, mask in error_masks:
+            invalid |= mask
+
+        # Errors (row snapshots only for the first reported invalid rows)
+        validation_errors = []
+        reported = index[invalid.to_numpy()][:max_errors]
+        if len(reported):
+            invalid_rows = df.loc[reported]
+
+            # One row of mask flags per reported row, as plain Python lists
+            flags = pd.concat([mask[reported] for _, mask in error_masks], axis=1).to_numpy().tolist()
+            messages = [
+                [message for (message, _), hit in zip(error_masks, row_flags) if hit]
+                for row_flags in flags
+            ]
+            for idx, errors, data in zip(invalid_rows.index, messages, invalid_rows.to_dict('records')):
+                validation_errors.append({
+                    'row_number': idx + 2,  # +2 for header row and 1-based indexing
+                    'errors': errors,
+                    'data': data
+                })
+
+        # Validated data for the remaining rows
+        valid = ~invalid
+        columns = {
+            'transaction_date': self._to_datetimes(transaction_dates[valid]),
+            'customer_state': customer_states[valid].tolist(),
+            'gross_amount': self._to_amounts(gross_amounts[valid], gross_invalid[valid]),
+        }
+        for column in ('tax_collected', 'shipping_amount'):
+            raw = fields.loc[valid, column]
+            amounts = self._parse_amounts(raw)
+            columns[column] = self._to_amounts(amounts, raw.notna() & amounts.isna())
+        for column in ('order_id', 'customer_id', 'marketplace_name'):
+            columns[column] = self._clean_text(fields.loc[valid, column]).tolist()
+        columns['is_marketplace_sale'] = fields.loc[valid, 'marketplace_name'].notna().tolist()
+        columns['is_exempt_sale'] = self._parse_flags(fields.loc[valid, 'is_exempt']).tolist()
+        columns['original_row_number'] = [str(idx + 2) for idx in index[valid]]
+
+        validated_rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+        return validated_rows, validation_errors
+
+    def _insert_transactions(self, validated_rows: List[Dict], analysis_id: str, db: Session) -> None:
+        """
+        Batch insert validated rows for an analysis (caller commits).
+
+        Rows go in as plain mappings; no Transaction objects are built. On
+        PostgreSQL they are streamed with COPY, elsewhere inserted with one
+        executemany.
+        """
+        if not validated_rows:
+            return
+
+        if db.get_bind().dialect.name == "postgresql":
+            self._copy_transactions(validated_rows, analysis_id, db)
+        else:
+            # render_nulls keeps rows with missing optional values in the same
+            # executemany batch instead of grouping them by which keys are None
+            db.execute(
+                insert(Transaction),
+                [{'analysis_id': analysis_id, **result} for result in validated_rows],
+                execution_options={'render_nulls': True}
+            )
+
+    @staticmethod
+    def _copy_value(value) -> str:
+        """Format one value for COPY's text format (None -> NULL)."""
+        if value is None:
+            return '\\N'
+        if isinstance(value, str):
+            return value.translate(_COPY_ESCAPES)
+        return str(value)
+
+    @classmethod
+    def _copy_transactions(cls, validated_rows: List[Dict], analysis_id: str, db: Session) -> None:
+        """COPY validated rows into transactions on the session's connection."""
+        columns = ['transaction_id', 'analysis_id', *validated_rows[0]]
+
+        # analysis_id is the same for every row, so date order is the order of
+        # ix_transactions_analysis_date; its leaf pages then fill sequentially
+        # instead of being dirtied at random
+        buffer = io.StringIO()
+        for result in sorted(validated_rows, key=itemgetter('transaction_date')):
+            fields = [str(uuid.uuid4()), str(analysis_id), *map(cls._copy_value, result.values())]
+            buffer.write('\t'.join(fields))
+            buffer.write('\n')
+        buffer.seek(0)
+
+        cursor = db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {Transaction.__tablename__} ({', '.join(columns)}) FROM STDIN",
+                buffer
+            )
+        finally:
+            cursor.close()
+
     def process_dataframe(
         self,
         df: pd.DataFrame,
@@ -365,23 +762,11 @@ class CSVProcessor:
         self.validation_errors = []
         self.valid_row_count = 0
         self.invalid_row_count = 0
-        valid_transactions = []
-
-        # Process each row
-        for idx, row in df.iterrows():
-            is_valid, result = self.validate_row(row, idx + 2)  # +2 for header row and 1-based indexing
-
-            if is_valid:
-                self.valid_row_count += 1
-                # Create transaction object
-                transaction = Transaction(
-                    analysis_id=analysis_id,
-                    **result
-                )
-                valid_transactions.append(transaction)
-            else:
-                self.invalid_row_count += 1
-                self.validation_errors.append(result)
+
+        # Validate all rows column-wise
+        validated_rows, self.validation_errors = self._validate_dataframe(df)
+        self.valid_row_count = len(validated_rows)
+        self.invalid_row_count = len(df) - self.valid_row_count
 
         # Calculate data quality percentage
         total_rows = len(df)
@@ -396,14 +781,14 @@ class CSVProcessor:
                 'invalid_rows': self.invalid_row_count,
                 'total_rows': total_rows,
                 'quality_percentage': quality_percentage,
-                'validation_errors': self.validation_errors[:100]  # Limit error list
+                'validation_errors': self.validation_errors
             }
 
         # Batch insert valid transactions
         try:
-            db.bulk_save_objects(valid_transactions)
+            self._insert_transactions(validated_rows, analysis_id, db)
             db.commit()
-            logger.info(f"Inserted {len(valid_transactions)} transactions")
+            logger.info(f"Inserted {len(validated_rows)} transactions")
         except Exception as e:
             db.rollback()
             logger.error(f"Failed to insert transactions: {e}")
@@ -420,7 +805,134 @@ class CSVProcessor:
             'invalid_rows': self.invalid_row_count,
             'total_rows': total_rows,
             'quality_percentage': quality_percentage,
-            'validation_errors': self.validation_errors[:100]  # Include some errors for reporting
+            'validation_errors': self.validation_errors
+        }
+
+    def _validated_chunks(self, reader) -> Iterator[Tuple[int, List[Dict], List[Dict]]]:
+        """
+        Normalize and validate each chunk from a read_csv chunk reader.
+
+        Yields:
+            Tuple of (chunk row count, validated row dicts, error dicts)
+        """
+        column_mapping = None
+        date_formats = None
+        for chunk in reader:
+            if column_mapping is None:
+                column_mapping = self.normalize_column_names(chunk.columns.tolist())
+            chunk.rename(columns=column_mapping, inplace=True)
+
+            # Sample the date format order from the first chunk only, so an
+            # ambiguous date like 03/04/2024 reads the same in every chunk
+            if date_formats is None:
+                dates = chunk['transaction_date'] if 'transaction_date' in chunk.columns else pd.Series(dtype=object)
+                date_formats = self._date_format_order(dates)
+
+            # Chunks keep a running index, so row numbers match the file
+            validated_rows, validation_errors = self._validate_dataframe(chunk, date_formats=date_formats)
+            yield len(chunk), validated_rows, validation_errors
+
+    def process_stream(
+        self,
+        file_content: bytes,
+        analysis_id: str,
+        db: Session,
+        chunksize: int = 100_000
+    ) -> Dict:
+        """
+        Parse, validate and insert a CSV file in chunks of rows.
+
+        Equivalent to parse_csv followed by process_dataframe, but memory
+        is bounded by chunksize: at most two chunks (the one being inserted
+        and the one validated ahead of it) and their validated row dicts
+        are held at a time. Chunks are inserted as they are validated and
+        committed together at the end, so a file that fails the quality
+        threshold inserts nothing.
+
+        Args:
+            file_content: Raw CSV file bytes
+            analysis_id: Analysis UUID
+            db: Database session
+            chunksize: Number of rows per chunk
+
+        Returns:
+            Dict with processing results (same shape as process_dataframe)
+        """
+        self.validation_errors = []
+        self.valid_row_count = 0
+        self.invalid_row_count = 0
+        total_rows = 0
+
+        encoding = self.detect_encoding(file_content)
+        reader = pd.read_csv(
+            io.BytesIO(file_content),
+            encoding=encoding,
+            encoding_errors='ignore',
+            skipinitialspace=True,
+            dtype=self._column_dtypes(file_content, encoding),
+            chunksize=chunksize
+        )
+
+        try:
+            # Parse and validate the next chunk on a worker thread while the
+            # current one is inserted; at most one chunk is read ahead
+            with reader, ThreadPoolExecutor(max_workers=1, thread_name_prefix="csv-validate") as executor:
+                chunks = self._validated_chunks(reader)
+                pending = executor.submit(next, chunks, None)
+                while (chunk_result := pending.result()) is not None:
+                    pending = executor.submit(next, chunks, None)
+
+                    chunk_rows, validated_rows, validation_errors = chunk_result
+                    self.valid_row_count += len(validated_rows)
+                    self.invalid_row_count += chunk_rows - len(validated_rows)
+                    total_rows += chunk_rows
+
+                    # Only the first errors are reported
+                    if len(self.validation_errors) < MAX_REPORTED_ERRORS:
+                        self.validation_errors.extend(validation_errors[:MAX_REPORTED_ERRORS - len(self.validation_errors)])
+
+                    try:
+                        self._insert_transactions(validated_rows, analysis_id, db)
+                    except Exception as e:
+                        db.rollback()
+                        logger.error(f"Failed to insert transactions: {e}")
+                        return {
+                            'success': False,
+                            'error': f"Database error: {str(e)}",
+                            'valid_rows': self.valid_row_count,
+                            'invalid_rows': self.invalid_row_count
+                        }
+        except Exception:
+            # Don't leave earlier chunks pending in the caller's session
+            db.rollback()
+            raise
+
+        # Calculate data quality percentage
+        quality_percentage = (self.valid_row_count / total_rows * 100) if total_rows > 0 else 0
+
+        # Check if quality meets threshold (80%)
+        if quality_percentage < 80:
+            db.rollback()
+            return {
+                'success': False,
+                'error': f"Data quality too low: {quality_percentage:.1f}% valid rows (minimum 80% required)",
+                'valid_rows': self.valid_row_count,
+                'invalid_rows': self.invalid_row_count,
+                'total_rows': total_rows,
+                'quality_percentage': quality_percentage,
+                'validation_errors': self.validation_errors
+            }
+
+        db.commit()
+        logger.info(f"Inserted {self.valid_row_count} transactions from {total_rows} rows")
+
+        return {
+            'success': True,
+            'valid_rows': self.valid_row_count,
+            'invalid_rows': self.invalid_row_count,
+            'total_rows': total_rows,
+            'quality_percentage': quality_percentage,
+            'validation_errors': self.validation_errors
         }
 
 
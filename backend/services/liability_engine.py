@@ -2,13 +2,14 @@
 Liability estimation engine for sales tax liability calculations.
 """
 
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import and_, case, func, or_, select
 from typing import Dict, Optional, List, Tuple
 from datetime import date, datetime
-from decimal import Decimal
-from dateutil.relativedelta import relativedelta
+import calendar
 import logging
+import threading
+import time
 
 from models.nexus_result import NexusResult, NexusStatus
 from models.transaction import Transaction
@@ -27,6 +28,56 @@ MONTHLY_INTEREST_RATE = 0.01  # 1% monthly interest (12% annual)
 DEFAULT_LOOKBACK_MONTHS = 36  # 3 years is common
 MAX_LOOKBACK_MONTHS = 48  # 4 years maximum
 
+# Sales totals for a state with no transactions in the period
+NO_SALES = (0, 0, 0)
+
+# Process-wide copy of the state_tax_config reference table, keyed by
+# state_code. Entries are transient StateTaxConfig objects built from plain
+# rows, so they belong to no session and stay readable after the loading
+# session commits or closes. The table is reloaded every
+# _TAX_CONFIG_CACHE_TTL seconds, so changes to it (e.g. from the seed
+# scripts, which run in their own processes) show up within that time;
+# clear_tax_config_cache() only affects the current process.
+_TAX_CONFIG_CACHE_TTL = 300
+_tax_config_cache: Optional[Tuple[float, Dict[str, StateTaxConfig]]] = None
+_tax_config_cache_lock = threading.Lock()
+
+
+def clear_tax_config_cache() -> None:
+    """Drop the cached tax configs so the next calculation reloads them."""
+    global _tax_config_cache
+
+    with _tax_config_cache_lock:
+        _tax_config_cache = None
+
+
+def _load_tax_configs(db: Session) -> Dict[str, StateTaxConfig]:
+    """
+    Get all state tax configs, keyed by state code.
+
+    Args:
+        db: Database session, used only when the cache is empty or stale
+
+    Returns:
+        Dict of state code to (transient) StateTaxConfig
+    """
+    global _tax_config_cache
+
+    now = time.time()
+    with _tax_config_cache_lock:
+        cached = _tax_config_cache
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    # Select plain rows rather than entities: querying StateTaxConfig would
+    # hand back (and let us detach) objects already in the caller's session
+    rows = db.execute(select(StateTaxConfig.__table__)).all()
+    tax_configs = {row.state_code: StateTaxConfig(**row._mapping) for row in rows}
+    with _tax_config_cache_lock:
+        _tax_config_cache = (now + _TAX_CONFIG_CACHE_TTL, tax_configs)
+
+    return tax_configs
+
 
 class LiabilityEngine:
     """Engine for estimating sales tax liability."""
@@ -64,6 +115,9 @@ class LiabilityEngine:
         if exemption_rate is None:
             exemption_rate = DEFAULT_EXEMPTION_RATE
 
+        # Evaluate all states as of the same day
+        today = date.today()
+
         # Get analysis
         analysis = self.db.query(Analysis).filter(
             Analysis.analysis_id == analysis_id
@@ -72,8 +126,17 @@ class LiabilityEngine:
         if not analysis:
             raise ValueError(f"Analysis {analysis_id} not found")
 
-        # Get nexus results for states with nexus
-        nexus_results = self.db.query(NexusResult).filter(
+        # Get nexus results for states with nexus, loading only the columns
+        # the estimates are built from
+        nexus_results = self.db.query(NexusResult).options(
+            load_only(
+                NexusResult.result_id,
+                NexusResult.state,
+                NexusResult.nexus_status,
+                NexusResult.registration_deadline,
+                NexusResult.confidence_level
+            )
+        ).filter(
             NexusResult.analysis_id == analysis_id,
             NexusResult.nexus_status.in_([
                 NexusStatus.NEXUS_PHYSICAL,
@@ -83,52 +146,79 @@ class LiabilityEngine:
 
         logger.info(f"Calculating liability for {len(nexus_results)} states with nexus")
 
-        liability_estimates = []
+        # Get tax configs (reference data, cached across calculations)
+        tax_configs = _load_tax_configs(self.db) if nexus_results else {}
+
+        # Settle which states get an estimate and each state's lookback
+        # window first, so sales can be summed for all states at once
+        estimated_states = []
+        lookback_periods = {}
 
         for nexus_result in nexus_results:
             state = nexus_result.state
 
             # Get state tax config
-            tax_config = self.db.query(StateTaxConfig).filter(
-                StateTaxConfig.state_code == state
-            ).first()
+            tax_config = tax_configs.get(state)
 
             if not tax_config or not tax_config.has_sales_tax:
                 logger.warning(f"No tax config for {state}, skipping")
                 continue
 
+            # Determine lookback period
+            lookback_months = custom_lookback_months or self._determine_lookback_period(
+                state,
+                nexus_result.nexus_date,
+                today
+            )
+
+            if nexus_result.nexus_date and lookback_months > 0:
+                lookback_periods[state] = self._calculate_lookback_dates(
+                    nexus_result.nexus_date,
+                    lookback_months
+                )
+
+            estimated_states.append((nexus_result, tax_config, lookback_months))
+
+        # Sum sales per state in two grouped queries: one over the analysis
+        # period, one over each state's own lookback window
+        period_sales = self._sum_sales_by_state(
+            analysis_id,
+            {
+                nexus_result.state: (analysis.period_start, analysis.period_end)
+                for nexus_result, _, _ in estimated_states
+            }
+        )
+        lookback_sales = self._sum_sales_by_state(analysis_id, lookback_periods)
+
+        liability_estimates = []
+
+        for nexus_result, tax_config, lookback_months in estimated_states:
+            state = nexus_result.state
+
+            # Rates (percent) as floats, shared by both periods and the estimate
+            state_tax_rate = float(tax_config.state_tax_rate)
+            avg_local_tax_rate = float(tax_config.avg_local_tax_rate or 0)
+
             # Calculate period liability
             period_liability = self._calculate_period_liability(
-                analysis_id,
-                state,
-                tax_config,
-                analysis.period_start,
-                analysis.period_end,
+                period_sales.get(state, NO_SALES),
+                state_tax_rate,
+                avg_local_tax_rate,
                 exemption_rate
             )
 
             # Calculate lookback period liability
-            lookback_months = custom_lookback_months or self._determine_lookback_period(
-                state,
-                nexus_result.nexus_date
-            )
-
             lookback_liability = None
             lookback_start_date = None
             lookback_end_date = None
 
-            if nexus_result.nexus_date and lookback_months > 0:
-                lookback_start_date, lookback_end_date = self._calculate_lookback_dates(
-                    nexus_result.nexus_date,
-                    lookback_months
-                )
+            if state in lookback_periods:
+                lookback_start_date, lookback_end_date = lookback_periods[state]
 
                 lookback_liability = self._calculate_period_liability(
-                    analysis_id,
-                    state,
-                    tax_config,
-                    lookback_start_date,
-                    lookback_end_date,
+                    lookback_sales.get(state, NO_SALES),
+                    state_tax_rate,
+                    avg_local_tax_rate,
                     exemption_rate
                 )
 
@@ -137,20 +227,23 @@ class LiabilityEngine:
             interest_amount = None
             total_liability_with_penalties = None
 
-            if include_penalties and nexus_result.registration_deadline:
-                if date.today() > nexus_result.registration_deadline:
-                    # Calculate penalties for late registration
-                    penalty_amount, interest_amount = self._calculate_penalties(
-                        period_liability['mid_estimate'],
-                        nexus_result.registration_deadline,
-                        date.today()
-                    )
-
-                    total_liability_with_penalties = (
-                        period_liability['mid_estimate'] +
-                        penalty_amount +
-                        interest_amount
-                    )
+            if (
+                include_penalties and
+                nexus_result.registration_deadline and
+                today > nexus_result.registration_deadline
+            ):
+                # Calculate penalties for late registration
+                penalty_amount, interest_amount = self._calculate_penalties(
+                    period_liability['mid_estimate'],
+                    nexus_result.registration_deadline,
+                    today
+                )
+
+                total_liability_with_penalties = (
+                    period_liability['mid_estimate'] +
+                    penalty_amount +
+                    interest_amount
+                )
 
             # Calculate risk assessment
             risk_level = self._assess_risk(
@@ -187,8 +280,8 @@ class LiabilityEngine:
                 exempt_sales=period_liability['exempt_sales'],
                 marketplace_sales=period_liability['marketplace_sales'],
                 taxable_sales=period_liability['taxable_sales'],
-                state_tax_rate=float(tax_config.state_tax_rate),
-                avg_local_tax_rate=float(tax_config.avg_local_tax_rate) if tax_config.avg_local_tax_rate else None,
+                state_tax_rate=state_tax_rate,
+                avg_local_tax_rate=avg_local_tax_rate or None,
                 estimated_liability_low=period_liability['low_estimate'],
                 estimated_liability_mid=period_liability['mid_estimate'],
                 estimated_liability_high=period_liability['high_estimate'],
@@ -196,9 +289,9 @@ class LiabilityEngine:
                 lookback_start_date=lookback_start_date,
                 lookback_end_date=lookback_end_date,
                 lookback_liability_estimate=lookback_liability['mid_estimate'] if lookback_liability else None,
-                penalty_amount=float(penalty_amount) if penalty_amount else None,
-                interest_amount=float(interest_amount) if interest_amount else None,
-                total_liability_with_penalties=float(total_liability_with_penalties) if total_liability_with_penalties else None,
+                penalty_amount=penalty_amount or None,
+                interest_amount=interest_amount or None,
+                total_liability_with_penalties=total_liability_with_penalties or None,
                 exemption_rate_assumed=float(exemption_rate),
                 risk_level=risk_level,
                 recommendation=recommendation,
@@ -206,60 +299,92 @@ class LiabilityEngine:
             )
 
             liability_estimates.append(estimate)
-            self.db.add(estimate)
 
-        # Commit all estimates
+        # Insert all estimates in one batch; the session doesn't need to
+        # track them, they're only returned for summarizing
+        self.db.bulk_save_objects(liability_estimates)
         self.db.commit()
 
         logger.info(f"Liability calculation complete: {len(liability_estimates)} states processed")
         return liability_estimates
 
-    def _calculate_period_liability(
+    def _sum_sales_by_state(
         self,
         analysis_id: str,
-        state: str,
-        tax_config: StateTaxConfig,
-        period_start: date,
-        period_end: date,
-        exemption_rate: float
-    ) -> Dict:
+        periods: Dict[str, Tuple[date, date]]
+    ) -> Dict[str, Tuple]:
         """
-        Calculate liability for a specific period.
+        Sum sales breakdowns per state, each over its own period.
+
+        All states are summed in one grouped query; states that share a
+        period are matched together.
 
         Args:
             analysis_id: Analysis UUID
-            state: State code
-            tax_config: State tax configuration
-            period_start: Period start date
-            period_end: Period end date
-            exemption_rate: Exemption rate to apply
+            periods: State code to (period_start, period_end), inclusive
 
         Returns:
-            Dict with liability calculations
+            Dict of state code to (gross_sales, exempt_sales,
+            marketplace_sales); states without sales in their period are
+            omitted
         """
-        # Get transactions for the state in the period
-        transactions = self.db.query(Transaction).filter(
+        if not periods:
+            return {}
+
+        states_by_period = {}
+        for state, period in periods.items():
+            states_by_period.setdefault(period, []).append(state)
+
+        rows = self.db.query(
+            Transaction.customer_state,
+            func.sum(Transaction.gross_amount),
+            # Explicitly exempt sales
+            func.sum(case((Transaction.is_exempt_sale, Transaction.gross_amount), else_=0)),
+            # Marketplace facilitator sales
+            func.sum(case((Transaction.is_marketplace_sale, Transaction.gross_amount), else_=0))
+        ).filter(
             Transaction.analysis_id == analysis_id,
-            Transaction.customer_state == state,
-            Transaction.transaction_date >= period_start,
-            Transaction.transaction_date <= period_end
-        ).all()
+            or_(*(
+                and_(
+                    Transaction.customer_state.in_(states),
+                    Transaction.transaction_date >= period_start,
+                    Transaction.transaction_date <= period_end
+                )
+                for (period_start, period_end), states in states_by_period.items()
+            ))
+        ).group_by(
+            Transaction.customer_state
+        )
 
-        # Calculate sales breakdowns
-        gross_sales = Decimal('0')
-        exempt_sales = Decimal('0')
-        marketplace_sales = Decimal('0')
+        return {state: tuple(totals) for state, *totals in rows}
 
-        for txn in transactions:
-            gross_sales += txn.gross_amount
+    def _calculate_period_liability(
+        self,
+        sales: Tuple,
+        state_tax_rate: float,
+        avg_local_tax_rate: float,
+        exemption_rate: float
+    ) -> Dict:
+        """
+        Calculate liability for a specific period.
 
-            # Track explicitly exempt sales
-            if txn.is_exempt_sale:
-                exempt_sales += txn.gross_amount
+        Args:
+            sales: (gross_sales, exempt_sales, marketplace_sales) for the
+                state in the period, see _sum_sales_by_state
+            state_tax_rate: State tax rate (percent)
+            avg_local_tax_rate: Average local tax rate (percent)
+            exemption_rate: Exemption rate to apply
 
-            # Track marketplace facilitator sales
-            if txn.is_marketplace_sale:
-                marketplace_sales += txn.gross_amount
+        Returns:
+            Dict with liability calculations
+        """
+        gross_sales, exempt_sales, marketplace_sales = sales
+
+        # Totals come back as Decimal; the estimates are reported as floats,
+        # so do the arithmetic in float throughout
+        gross_sales = float(gross_sales)
+        exempt_sales = float(exempt_sales)
+        marketplace_sales = float(marketplace_sales)
 
         # Calculate taxable sales base
         # Subtract marketplace (facilitator collects) and explicit exemptions
@@ -267,21 +392,21 @@ class LiabilityEngine:
 
         # Apply additional exemption rate assumption to remaining sales
         # This accounts for unidentified exempt sales (resale certs, etc.)
-        additional_exempt = potentially_taxable * Decimal(str(exemption_rate))
+        additional_exempt = potentially_taxable * exemption_rate
         taxable_sales = potentially_taxable - additional_exempt
 
         # Ensure non-negative
-        taxable_sales = max(taxable_sales, Decimal('0'))
+        taxable_sales = max(taxable_sales, 0.0)
 
         # Calculate liability estimates
-        state_rate = Decimal(str(tax_config.state_tax_rate)) / Decimal('100')
-        avg_local_rate = Decimal(str(tax_config.avg_local_tax_rate or 0)) / Decimal('100')
+        state_rate = state_tax_rate / 100
+        avg_local_rate = avg_local_tax_rate / 100
 
         # Low estimate: State rate only
         low_estimate = taxable_sales * state_rate
 
         # Mid estimate: State rate + 50% of average local rate
-        mid_rate = state_rate + (avg_local_rate * Decimal('0.5'))
+        mid_rate = state_rate + (avg_local_rate * 0.5)
         mid_estimate = taxable_sales * mid_rate
 
         # High estimate: State rate + full average local rate
@@ -289,22 +414,23 @@ class LiabilityEngine:
         high_estimate = taxable_sales * high_rate
 
         return {
-            'gross_sales': float(gross_sales),
-            'exempt_sales': float(exempt_sales),
-            'marketplace_sales': float(marketplace_sales),
-            'taxable_sales': float(taxable_sales),
-            'low_estimate': float(low_estimate),
-            'mid_estimate': float(mid_estimate),
-            'high_estimate': float(high_estimate),
-            'effective_rate_low': float(state_rate * 100),
-            'effective_rate_mid': float(mid_rate * 100),
-            'effective_rate_high': float(high_rate * 100)
+            'gross_sales': gross_sales,
+            'exempt_sales': exempt_sales,
+            'marketplace_sales': marketplace_sales,
+            'taxable_sales': taxable_sales,
+            'low_estimate': low_estimate,
+            'mid_estimate': mid_estimate,
+            'high_estimate': high_estimate,
+            'effective_rate_low': state_rate * 100,
+            'effective_rate_mid': mid_rate * 100,
+            'effective_rate_high': high_rate * 100
         }
 
     def _determine_lookback_period(
         self,
         state: str,
-        nexus_date: Optional[date]
+        nexus_date: Optional[date],
+        today: date
     ) -> int:
         """
         Determine appropriate lookback period in months.
@@ -312,6 +438,7 @@ class LiabilityEngine:
         Args:
             state: State code
             nexus_date: Date when nexus was established
+            today: Current date
 
         Returns:
             Lookback period in months
@@ -320,18 +447,14 @@ class LiabilityEngine:
             return 0
 
         # Calculate months since nexus establishment
-        today = date.today()
         months_since_nexus = (
             (today.year - nexus_date.year) * 12 +
             (today.month - nexus_date.month)
         )
 
-        # Most states have 3-year lookback for sales tax
-        # Cap at 4 years maximum
-        lookback_months = min(months_since_nexus, DEFAULT_LOOKBACK_MONTHS)
-        lookback_months = min(lookback_months, MAX_LOOKBACK_MONTHS)
-
-        return max(0, lookback_months)
+        # Most states have 3-year lookback for sales tax (already within the
+        # 4-year MAX_LOOKBACK_MONTHS cap)
+        return max(0, min(months_since_nexus, DEFAULT_LOOKBACK_MONTHS))
 
     def _calculate_lookback_dates(
         self,
@@ -348,8 +471,12 @@ class LiabilityEngine:
         Returns:
             Tuple of (start_date, end_date)
         """
-        # Lookback period is from nexus date back N months
-        start_date = nexus_date - relativedelta(months=lookback_months)
+        # Lookback period is from nexus date back N months, clamping the day
+        # to the end of a shorter month (Mar 31 - 1 month = Feb 28/29)
+        year, month = divmod(nexus_date.year * 12 + nexus_date.month - 1 - lookback_months, 12)
+        month += 1
+        day = min(nexus_date.day, calendar.monthrange(year, month)[1])
+        start_date = date(year, month, day)
         end_date = nexus_date
 
         return start_date, end_date
@@ -359,7 +486,7 @@ class LiabilityEngine:
         liability_amount: float,
         registration_deadline: date,
         current_date: date
-    ) -> Tuple[Decimal, Decimal]:
+    ) -> Tuple[float, float]:
         """
         Calculate penalty and interest for late registration.
 
@@ -372,12 +499,10 @@ class LiabilityEngine:
             Tuple of (penalty_amount, interest_amount)
         """
         if current_date <= registration_deadline:
-            return Decimal('0'), Decimal('0')
-
-        liability = Decimal(str(liability_amount))
+            return 0.0, 0.0
 
         # Calculate base penalty (typically 10% of liability)
-        penalty = liability * Decimal(str(DEFAULT_PENALTY_RATE))
+        penalty = liability_amount * DEFAULT_PENALTY_RATE
 
         # Calculate interest (1% per month)
         months_late = (
@@ -386,7 +511,7 @@ class LiabilityEngine:
         )
 
         # Interest compounds monthly
-        interest = liability * Decimal(str(MONTHLY_INTEREST_RATE)) * Decimal(str(months_late))
+        interest = liability_amount * MONTHLY_INTEREST_RATE * months_late
 
         return penalty, interest
 
@@ -64,7 +64,9 @@ class NexusEngine:
 
         # Get business profile if not provided
         if business_profile is None:
-            business_profile = self.db.query(BusinessProfile).filter(
+            business_profile = business_profile_service.with_locations(
+                self.db.query(BusinessProfile)
+            ).filter(
                 BusinessProfile.analysis_id == analysis_id
             ).first()
 
@@ -104,6 +104,22 @@ class TestAuthService:
         assert auth_service.verify_password(password, hashed) is True
         assert auth_service.verify_password("WrongPassword", hashed) is False
 
+    def test_verify_password_unknown_hash_format(self):
+        """Test hashes in an unknown format are rejected rather than raising."""
+        assert auth_service.verify_password("TestPassword123", "") is False
+        assert auth_service.verify_password("TestPassword123", "not-a-hash") is False
+
+    def test_legacy_bcrypt_hash_needs_rehash(self):
+        """Test legacy bcrypt hashes still verify and are flagged for upgrade."""
+        from passlib.hash import bcrypt
+
+        password = "TestPassword123"
+        legacy_hash = bcrypt.hash(password)
+
+        assert auth_service.verify_password(password, legacy_hash) is True
+        assert auth_service.password_needs_rehash(legacy_hash) is True
+        assert auth_service.password_needs_rehash(auth_service.hash_password(password)) is False
+
     def test_create_access_token(self):
         """Test JWT token creation."""
         data = {"sub": "test-user-id", "email": "test@example.com"}
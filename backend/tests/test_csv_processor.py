@@ -11,7 +11,7 @@ from sqlalchemy.pool import StaticPool
 from unittest.mock import Mock, patch, MagicMock
 import io
 import pandas as pd
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 
 from main import app
@@ -203,6 +203,18 @@ def test_validate_and_convert_amount():
     assert csv_processor.validate_and_convert_amount(pd.NA) == Decimal('0.00')
 
 
+def test_validate_and_convert_flag():
+    """Test yes/no flag conversion."""
+    assert csv_processor.validate_and_convert_flag('TRUE') is True
+    assert csv_processor.validate_and_convert_flag(' yes ') is True
+    assert csv_processor.validate_and_convert_flag(1) is True
+
+    # False-like strings and missing values are not truthy
+    assert csv_processor.validate_and_convert_flag('false') is False
+    assert csv_processor.validate_and_convert_flag('0') is False
+    assert csv_processor.validate_and_convert_flag(pd.NA) is False
+
+
 def test_validate_row_success(sample_csv_content):
     """Test row validation with valid data."""
     df = csv_processor.parse_csv(sample_csv_content)
@@ -250,6 +262,25 @@ def test_validate_row_with_errors(sample_csv_with_errors):
     assert 'Invalid amount' in result['errors']
 
 
+def test_validate_dataframe_out_of_range_dates():
+    """Test dates outside pandas' datetime64 range are accepted like validate_row does."""
+    csv_data = """date,state,amount
+0001-01-01,CA,100.00
+9999-12-31,NY,250.00
+2024-01-17,TX,150.00
+invalid-date,FL,200.00
+"""
+    df = csv_processor.parse_csv(csv_data.encode('utf-8'))
+
+    validated_rows, validation_errors = csv_processor._validate_dataframe(df)
+
+    assert [row['transaction_date'] for row in validated_rows] == [
+        datetime(1, 1, 1), datetime(9999, 12, 31), datetime(2024, 1, 17)
+    ]
+    assert [error['row_number'] for error in validation_errors] == [5]
+    assert validation_errors[0]['errors'] == ['Invalid date format']
+
+
 def test_process_dataframe_success(db_session, test_user, sample_csv_content):
     """Test DataFrame processing with valid data."""
     analysis = Analysis(
@@ -312,6 +343,68 @@ invalid,WA,800
     assert 'Data quality too low' in result['error']
 
 
+def test_process_stream_success(db_session, test_user, sample_csv_content):
+    """Test chunked processing matches whole-DataFrame processing."""
+    analysis = Analysis(
+        tenant_id=test_user.tenant_id,
+        created_by=test_user.user_id,
+        client_name="Test Client",
+        period_start=date(2024, 1, 1),
+        period_end=date(2024, 12, 31),
+        status=AnalysisStatus.PROCESSING_CSV
+    )
+    db_session.add(analysis)
+    db_session.commit()
+
+    result = csv_processor.process_stream(
+        sample_csv_content, analysis.analysis_id, db_session, chunksize=3
+    )
+
+    assert result['success'] is True
+    assert result['valid_rows'] == 4
+    assert result['invalid_rows'] == 0
+    assert result['total_rows'] == 4
+
+    transactions = db_session.query(Transaction).filter(
+        Transaction.analysis_id == analysis.analysis_id
+    ).all()
+    assert sorted(t.original_row_number for t in transactions) == ['2', '3', '4', '5']
+
+
+def test_process_stream_ambiguous_dates_consistent(db_session, test_user):
+    """Test an ambiguous date reads the same in every chunk of a file."""
+    analysis = Analysis(
+        tenant_id=test_user.tenant_id,
+        created_by=test_user.user_id,
+        client_name="Test Client",
+        period_start=date(2024, 1, 1),
+        period_end=date(2024, 12, 31),
+        status=AnalysisStatus.PROCESSING_CSV
+    )
+    db_session.add(analysis)
+    db_session.commit()
+
+    # First chunk is month-first; the second chunk's first 100 dates are
+    # day-first only
+    lines = ["date,state,amount", "03/04/2024,CA,100.00"]
+    lines += ["01/02/2024,CA,100.00"] * 149
+    lines += ["25/12/2024,CA,100.00"] * 149
+    lines += ["03/04/2024,CA,100.00"]
+    csv_data = "\n".join(lines).encode('utf-8')
+
+    result = csv_processor.process_stream(
+        csv_data, analysis.analysis_id, db_session, chunksize=150
+    )
+    assert result['success'] is True
+
+    transactions = db_session.query(Transaction).filter(
+        Transaction.analysis_id == analysis.analysis_id,
+        Transaction.original_row_number.in_(['2', str(len(lines))])
+    ).all()
+    assert len(transactions) == 2
+    assert {t.transaction_date for t in transactions} == {date(2024, 3, 4)}
+
+
 # ==================== CSV Upload API Tests ====================
 
 @patch('api.csv_processor.s3_service')
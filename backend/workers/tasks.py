@@ -47,13 +47,9 @@ def process_csv_file(self, analysis_id: str, csv_file_path: str):
         logger.info(f"Downloading CSV from {csv_file_path}")
         file_content = s3_service.download_file(csv_file_path)
 
-        # Parse CSV
-        logger.info(f"Parsing CSV for analysis {analysis_id}")
-        df = csv_processor.parse_csv(file_content)
-
-        # Process and validate
-        logger.info(f"Processing {len(df)} rows")
-        result = csv_processor.process_dataframe(df, analysis_id, db)
+        # Parse, validate and insert in chunks to bound memory use
+        logger.info(f"Processing CSV for analysis {analysis_id}")
+        result = csv_processor.process_stream(file_content, analysis_id, db)
 
         if result['success']:
             # Update analysis status